@@ -9,14 +9,28 @@ TABLE_FIELDS = {
         3: "type",
         4: "verse_count",
         5: "page_count",
+        6: "word_count",
+        7: "letter_count",
+        8: "character_count",
+    },
+    "parts": {
+        0: "id",
+        1: "name",
+        2: "verse_count",
+        3: "page_count",
+        4: "word_count",
+        5: "letter_count",
+        6: "character_count",
     },
-    "parts": {0: "id", 1: "name", 2: "verse_count", 3: "page_count"},
     "groups": {
         0: "id",
         1: "name",
         2: "verse_count",
         3: "page_count",
         4: "part_id",
+        5: "word_count",
+        6: "letter_count",
+        7: "character_count",
     },
     "quarters": {
         0: "id",
@@ -25,6 +39,9 @@ TABLE_FIELDS = {
         3: "page_count",
         4: "group_id",
         5: "part_id",
+        6: "word_count",
+        7: "letter_count",
+        8: "character_count",
     },
     "pages": {
         0: "id",
@@ -34,6 +51,9 @@ TABLE_FIELDS = {
         4: "group_id",
         5: "part_id",
         6: "quarter_id",
+        7: "word_count",
+        8: "letter_count",
+        9: "character_count",
     },
     "verses": {
         0: "id",
@@ -0,0 +1,368 @@
+"""Asyncio data access"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+
+# Constants
+BATCH_SIZE = 500
+# Host parameters per statement allowed by SQLite before 3.32
+MAX_VARIABLES = 999
+
+
+def normalize_key(key: Hashable) -> Hashable:
+    """
+    Converts the values of a lookup key to the integers SQLite compares them as,
+    so `"5"` and `5.0` share the lookup of `5` and match the returned rows.
+
+    Args:
+        key (Hashable): Lookup key, a value or a tuple of values
+
+    Returns:
+        Hashable: Normalized key
+    """
+
+    def normalize(value: Any) -> Any:
+        if isinstance(value, str):
+            try:
+                return int(value.strip())
+
+            except ValueError:
+                return value
+
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+
+        return value
+
+    if isinstance(key, tuple):
+        return tuple(normalize(value) for value in key)
+
+    return normalize(key)
+
+
+class Batcher:
+    """
+    Collects keys requested in the same event loop iteration and resolves
+    them with a single query.
+    """
+
+    def __init__(
+        self,
+        quran: "AsyncQuran",
+        query: str,
+        key: Sequence[int],
+        width: int = 1,
+    ) -> None:
+        """
+        Args:
+            quran (AsyncQuran): Data access object
+            query (str): Query with a `{keys}` placeholder for the key list
+            key (Sequence[int]): Indexes of the key columns in the result rows
+            width (int): Number of parameters per key
+        """
+
+        self.quran = quran
+        self.query = query
+        self.key = key
+        self.width = width
+        self.pending: Dict[Hashable, asyncio.Future] = {}
+        self.tasks: Set[asyncio.Future] = set()
+
+    async def get(self, key: Hashable) -> List[Tuple[Any, ...]]:
+        """
+        Returns the rows matching a key, sharing the lookup with concurrent callers.
+
+        Args:
+            key (Hashable): Lookup key
+
+        Returns:
+            List[Tuple[Any, ...]]: Matching rows
+        """
+
+        key = normalize_key(key)
+
+        if key in self.pending:
+            return await asyncio.shield(self.pending[key])
+
+        if not self.pending:
+            asyncio.get_running_loop().call_soon(self.flush)
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = future
+
+        return await asyncio.shield(future)
+
+    def flush(self) -> None:
+        """
+        Runs the pending lookups in batches of `BATCH_SIZE` keys, fewer when the
+        keys have several parameters, to stay within `MAX_VARIABLES`.
+        """
+
+        pending, self.pending = self.pending, {}
+        keys = list(pending)
+        size = min(BATCH_SIZE, MAX_VARIABLES // self.width)
+
+        for i in range(0, len(keys), size):
+            batch = {key: pending[key] for key in keys[i : i + size]}
+
+            # The event loop only keeps weak references to tasks
+            task = asyncio.ensure_future(self.resolve(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def resolve(self, batch: Dict[Hashable, asyncio.Future]) -> None:
+        """
+        Resolves a batch of lookups with one query.
+
+        Args:
+            batch (Dict[Hashable, asyncio.Future]): Futures by key
+        """
+
+        placeholder = "(" + ", ".join("?" * self.width) + ")"
+        params = [
+            value
+            for key in batch
+            for value in (key if isinstance(key, tuple) else (key,))
+        ]
+
+        try:
+            rows = await self.quran.fetchall(
+                self.query.format(
+                    keys=", ".join(
+                        placeholder if self.width > 1 else "?" for _ in batch
+                    )
+                ),
+                params,
+            )
+
+            # Keys without rows resolve to an empty list, rows of no key are skipped
+            results: Dict[Hashable, List[Tuple[Any, ...]]] = {key: [] for key in batch}
+            for row in rows:
+                key = tuple(row[i] for i in self.key)
+                key = key if self.width > 1 else key[0]
+
+                if key in results:
+                    results[key].append(row)
+
+            for key, future in batch.items():
+                if not future.done():
+                    future.set_result(results[key])
+
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+
+
+class AsyncQuran:
+    """
+    Asyncio interface to a generated Quran database.
+
+    Queries run on a dedicated thread pool, each thread holding its own read-only
+    connection. Identical concurrent queries are coalesced, verse and item lookups
+    made in the same event loop iteration are batched into single queries, and at
+    most `max_pending` lookups are in flight, further callers wait for a slot.
+
+    Examples:
+
+    ```python
+    async with AsyncQuran("db.sqlite3") as quran:
+        verse = await quran.get_verse(1, 1)
+        items = await quran.get_items(verse[0], collection_id=2)
+    ```
+    """
+
+    def __init__(
+        self,
+        database: Path | str,
+        workers: int = 4,
+        max_pending: int = 1024,
+    ) -> None:
+        """
+        Args:
+            database (Path | str): Database file
+            workers (int): Number of threads (read-only connections)
+            max_pending (int): Maximum number of lookups in flight
+        """
+
+        self.database = Path(database)
+        self.local = threading.local()
+        self.connections: List[sqlite3.Connection] = []
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="quran-cli"
+        )
+        self.slots = asyncio.Semaphore(max_pending)
+        self.inflight: Dict[Tuple[str, Tuple[Any, ...]], asyncio.Future] = {}
+
+        self.verses = Batcher(
+            self,
+            'SELECT * FROM "verses" WHERE "id" IN ({keys})',
+            key=(0,),
+        )
+        self.numbers = Batcher(
+            self,
+            'SELECT * FROM "verses" WHERE ("chapter_id", "number") IN (VALUES {keys})',
+            key=(3, 1),
+            width=2,
+        )
+        self.items = Batcher(
+            self,
+            'SELECT * FROM "items" WHERE "verse_id" IN ({keys}) ORDER BY "id"',
+            key=(4,),
+        )
+        self.collection_items = Batcher(
+            self,
+            'SELECT * FROM "items" WHERE ("verse_id", "collection_id") '
+            'IN (VALUES {keys}) ORDER BY "id"',
+            key=(4, 3),
+            width=2,
+        )
+
+    async def __aenter__(self) -> "AsyncQuran":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Returns the read-only connection of the current worker thread.
+
+        Returns:
+            sqlite3.Connection: Database connection
+        """
+
+        connection = getattr(self.local, "connection", None)
+
+        if connection is None:
+            connection = sqlite3.connect(
+                f"{self.database.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+            self.local.connection = connection
+
+            with self.lock:
+                self.connections.append(connection)
+
+        return connection
+
+    def run(self, query: str, params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        """
+        Runs a query on the current worker thread.
+
+        Args:
+            query (str): SQL query
+            params (Sequence[Any]): Query parameters
+
+        Returns:
+            List[Tuple[Any, ...]]: Result rows
+        """
+
+        return self.connect().execute(query, params).fetchall()
+
+    async def fetchall(
+        self, query: str, params: Sequence[Any] = ()
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Runs a query on the thread pool, sharing the result with identical
+        concurrent queries.
+
+        Args:
+            query (str): SQL query
+            params (Sequence[Any]): Query parameters
+
+        Returns:
+            List[Tuple[Any, ...]]: Result rows
+        """
+
+        key = (query, tuple(params))
+
+        if key in self.inflight:
+            return await asyncio.shield(self.inflight[key])
+
+        future = asyncio.ensure_future(
+            asyncio.get_running_loop().run_in_executor(
+                self.executor, self.run, query, key[1]
+            )
+        )
+        self.inflight[key] = future
+
+        try:
+            return await asyncio.shield(future)
+
+        finally:
+            if self.inflight.get(key) is future:
+                del self.inflight[key]
+
+    async def get_verse(
+        self, chapter_id: int, verse_number: int
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Get a verse by chapter id and verse number.
+
+        Args:
+            chapter_id (int): Chapter ID
+            verse_number (int): Verse number
+
+        Returns:
+            Optional[Tuple[Any, ...]]: Verse row
+        """
+
+        async with self.slots:
+            rows = await self.numbers.get((chapter_id, verse_number))
+
+        return rows[0] if rows else None
+
+    async def get_verse_by_id(self, verse_id: int) -> Optional[Tuple[Any, ...]]:
+        """
+        Get a verse by id.
+
+        Args:
+            verse_id (int): Verse ID
+
+        Returns:
+            Optional[Tuple[Any, ...]]: Verse row
+        """
+
+        async with self.slots:
+            rows = await self.verses.get(verse_id)
+
+        return rows[0] if rows else None
+
+    async def get_items(
+        self, verse_id: int, collection_id: Optional[int] = None
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Get the items (translations, interpretations...) of a verse.
+
+        Args:
+            verse_id (int): Verse ID
+            collection_id (int): Only return items of this collection
+
+        Returns:
+            List[Tuple[Any, ...]]: Item rows
+        """
+
+        async with self.slots:
+            if collection_id is None:
+                return await self.items.get(verse_id)
+
+            return await self.collection_items.get((verse_id, collection_id))
+
+    async def close(self) -> None:
+        """Shuts the thread pool down and closes the connections."""
+
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+        with self.lock:
+            for connection in self.connections:
+                connection.close()
+
+            self.connections.clear()
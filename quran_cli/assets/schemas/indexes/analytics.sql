@@ -0,0 +1,20 @@
+--
+-- Index profile: analytics
+-- The reader indexes, plus whole-collection scans in verse order, hierarchy
+-- foreign keys for joins and grouping, and word lookups in both forms.
+--
+CREATE INDEX "verses_group_id_bb09b36d" ON "verses" ("group_id");
+CREATE INDEX "verses_page_id_932c96e6" ON "verses" ("page_id");
+CREATE INDEX "verses_part_id_cdcfce14" ON "verses" ("part_id");
+CREATE INDEX "verses_quarter_id_3a00848c" ON "verses" ("quarter_id");
+CREATE INDEX "groups_part_id_5cc7ea42" ON "groups" ("part_id");
+CREATE INDEX "quarters_group_id_425bbd82" ON "quarters" ("group_id");
+CREATE INDEX "quarters_part_id_ffd45a90" ON "quarters" ("part_id");
+CREATE INDEX "pages_chapter_id_a917d251" ON "pages" ("chapter_id");
+CREATE INDEX "pages_group_id_43ecf6a9" ON "pages" ("group_id");
+CREATE INDEX "pages_part_id_a8f68ff7" ON "pages" ("part_id");
+CREATE INDEX "pages_quarter_id_48c3ef2b" ON "pages" ("quarter_id");
+CREATE INDEX "items_verse_id_collection_id_6826c43f" ON "items" ("verse_id", "collection_id");
+CREATE INDEX "items_collection_id_verse_id_4c9442e6" ON "items" ("collection_id", "verse_id");
+CREATE INDEX "words_content_ccca0141" ON "words" ("content");
+CREATE INDEX "words_unaccent_content_2771559e" ON "words" ("unaccent_content");
@@ -0,0 +1,35 @@
+--
+-- Index profile: django
+-- The single-column indexes of the normalized and complementary schemas.
+--
+CREATE INDEX "chapters_verse_count_5777cda7" ON "chapters" ("verse_count");
+CREATE INDEX "chapters_page_count_7f097df8" ON "chapters" ("page_count");
+CREATE INDEX "parts_verse_count_9501296e" ON "parts" ("verse_count");
+CREATE INDEX "parts_page_count_606da20b" ON "parts" ("page_count");
+CREATE INDEX "groups_verse_count_cbf9c194" ON "groups" ("verse_count");
+CREATE INDEX "groups_page_count_1e918a07" ON "groups" ("page_count");
+CREATE INDEX "groups_part_id_5cc7ea42" ON "groups" ("part_id");
+CREATE INDEX "quarters_verse_count_3da85c21" ON "quarters" ("verse_count");
+CREATE INDEX "quarters_page_count_ac1d8f5e" ON "quarters" ("page_count");
+CREATE INDEX "quarters_group_id_425bbd82" ON "quarters" ("group_id");
+CREATE INDEX "quarters_part_id_ffd45a90" ON "quarters" ("part_id");
+CREATE INDEX "pages_verse_count_c0e0d056" ON "pages" ("verse_count");
+CREATE INDEX "pages_chapter_id_a917d251" ON "pages" ("chapter_id");
+CREATE INDEX "pages_group_id_43ecf6a9" ON "pages" ("group_id");
+CREATE INDEX "pages_part_id_a8f68ff7" ON "pages" ("part_id");
+CREATE INDEX "pages_quarter_id_48c3ef2b" ON "pages" ("quarter_id");
+CREATE INDEX "verses_number_3a23b3b1" ON "verses" ("number");
+CREATE INDEX "verses_content_16c09417" ON "verses" ("content");
+CREATE INDEX "verses_chapter_id_b472115e" ON "verses" ("chapter_id");
+CREATE INDEX "verses_group_id_bb09b36d" ON "verses" ("group_id");
+CREATE INDEX "verses_page_id_932c96e6" ON "verses" ("page_id");
+CREATE INDEX "verses_part_id_cdcfce14" ON "verses" ("part_id");
+CREATE INDEX "verses_quarter_id_3a00848c" ON "verses" ("quarter_id");
+CREATE INDEX "collections_description_64108f9e" ON "collections" ("description");
+CREATE INDEX "collections_language_id_dfff5c53" ON "collections" ("language_id");
+CREATE INDEX "items_content_9e1aa50c" ON "items" ("content");
+CREATE INDEX "items_chapter_id_15e22b60" ON "items" ("chapter_id");
+CREATE INDEX "items_collection_id_e4b7bb9c" ON "items" ("collection_id");
+CREATE INDEX "items_verse_id_8f001483" ON "items" ("verse_id");
+CREATE INDEX "words_content_ccca0141" ON "words" ("content");
+CREATE INDEX "words_unaccent_content_2771559e" ON "words" ("unaccent_content");
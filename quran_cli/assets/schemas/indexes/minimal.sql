@@ -0,0 +1,4 @@
+--
+-- Index profile: minimal
+-- Only the primary keys and unique constraints, smallest file.
+--
@@ -0,0 +1,11 @@
+--
+-- Index profile: reader
+-- Verse navigation by chapter, part, group, quarter and page, and the items
+-- of a verse in a collection.
+--
+CREATE INDEX "verses_group_id_bb09b36d" ON "verses" ("group_id");
+CREATE INDEX "verses_page_id_932c96e6" ON "verses" ("page_id");
+CREATE INDEX "verses_part_id_cdcfce14" ON "verses" ("part_id");
+CREATE INDEX "verses_quarter_id_3a00848c" ON "verses" ("quarter_id");
+CREATE INDEX "items_verse_id_collection_id_6826c43f" ON "items" ("verse_id", "collection_id");
+CREATE INDEX "words_unaccent_content_2771559e" ON "words" ("unaccent_content");
@@ -0,0 +1,15 @@
+--
+-- Items layout: clustered
+-- Items stored in (collection_id, verse_id) order in the primary key B-tree,
+-- a collection is a contiguous range and the items of a verse are adjacent.
+-- The ids stay unique and are looked up through the index of the constraint.
+--
+CREATE TABLE "items_layout" (
+  "id" integer NOT NULL,
+  "content" text NOT NULL,
+  "chapter_id" bigint NULL REFERENCES "chapters" ("id") DEFERRABLE INITIALLY DEFERRED,
+  "collection_id" bigint NOT NULL REFERENCES "collections" ("id") DEFERRABLE INITIALLY DEFERRED,
+  "verse_id" bigint NOT NULL REFERENCES "verses" ("id") DEFERRABLE INITIALLY DEFERRED,
+  PRIMARY KEY ("collection_id", "verse_id", "id"),
+  UNIQUE ("id")
+) WITHOUT ROWID;
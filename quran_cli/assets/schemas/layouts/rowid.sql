@@ -0,0 +1,11 @@
+--
+-- Items layout: rowid
+-- Items in insertion order, the default layout of comp.sql.
+--
+CREATE TABLE "items_layout" (
+  "id" integer NOT NULL PRIMARY KEY AUTOINCREMENT,
+  "content" text NOT NULL,
+  "chapter_id" bigint NULL REFERENCES "chapters" ("id") DEFERRABLE INITIALLY DEFERRED,
+  "collection_id" bigint NOT NULL REFERENCES "collections" ("id") DEFERRABLE INITIALLY DEFERRED,
+  "verse_id" bigint NULL REFERENCES "verses" ("id") DEFERRABLE INITIALLY DEFERRED
+);
@@ -14,7 +14,10 @@ CREATE TABLE "chapters" (
   "order" smallint unsigned NOT NULL UNIQUE CHECK ("order" >= 0),
   "type" bool NOT NULL,
   "verse_count" smallint unsigned NOT NULL CHECK ("verse_count" >= 0) DEFAULT 0,
-  "page_count" smallint unsigned NOT NULL CHECK ("page_count" >= 0) DEFAULT 0
+  "page_count" smallint unsigned NOT NULL CHECK ("page_count" >= 0) DEFAULT 0,
+  "word_count" integer unsigned NOT NULL CHECK ("word_count" >= 0) DEFAULT 0,
+  "letter_count" integer unsigned NOT NULL CHECK ("letter_count" >= 0) DEFAULT 0,
+  "character_count" integer unsigned NOT NULL CHECK ("character_count" >= 0) DEFAULT 0
 );
 
 CREATE INDEX "chapters_verse_count_5777cda7" ON "chapters" ("verse_count");
@@ -29,7 +32,10 @@ CREATE TABLE "parts" (
   "id" integer NOT NULL PRIMARY KEY AUTOINCREMENT,
   "name" varchar(16) NOT NULL UNIQUE,
   "verse_count" smallint unsigned NOT NULL CHECK ("verse_count" >= 0) DEFAULT 0,
-  "page_count" smallint unsigned NOT NULL CHECK ("page_count" >= 0) DEFAULT 0
+  "page_count" smallint unsigned NOT NULL CHECK ("page_count" >= 0) DEFAULT 0,
+  "word_count" integer unsigned NOT NULL CHECK ("word_count" >= 0) DEFAULT 0,
+  "letter_count" integer unsigned NOT NULL CHECK ("letter_count" >= 0) DEFAULT 0,
+  "character_count" integer unsigned NOT NULL CHECK ("character_count" >= 0) DEFAULT 0
 );
 
 CREATE INDEX "parts_verse_count_9501296e" ON "parts" ("verse_count");
@@ -45,7 +51,10 @@ CREATE TABLE "groups" (
   "name" varchar(16) NOT NULL UNIQUE,
   "verse_count" smallint unsigned NOT NULL CHECK ("verse_count" >= 0) DEFAULT 0,
   "page_count" smallint unsigned NOT NULL CHECK ("page_count" >= 0) DEFAULT 0,
-  "part_id" bigint NULL REFERENCES "parts" ("id") DEFERRABLE INITIALLY DEFERRED
+  "part_id" bigint NULL REFERENCES "parts" ("id") DEFERRABLE INITIALLY DEFERRED,
+  "word_count" integer unsigned NOT NULL CHECK ("word_count" >= 0) DEFAULT 0,
+  "letter_count" integer unsigned NOT NULL CHECK ("letter_count" >= 0) DEFAULT 0,
+  "character_count" integer unsigned NOT NULL CHECK ("character_count" >= 0) DEFAULT 0
 );
 
 CREATE INDEX "groups_verse_count_cbf9c194" ON "groups" ("verse_count");
@@ -63,7 +72,10 @@ CREATE TABLE "quarters" (
   "verse_count" smallint unsigned NOT NULL CHECK ("verse_count" >= 0) DEFAULT 0,
   "page_count" smallint unsigned NOT NULL CHECK ("page_count" >= 0) DEFAULT 0,
   "group_id" bigint NULL REFERENCES "groups" ("id") DEFERRABLE INITIALLY DEFERRED,
-  "part_id" bigint NULL REFERENCES "parts" ("id") DEFERRABLE INITIALLY DEFERRED
+  "part_id" bigint NULL REFERENCES "parts" ("id") DEFERRABLE INITIALLY DEFERRED,
+  "word_count" integer unsigned NOT NULL CHECK ("word_count" >= 0) DEFAULT 0,
+  "letter_count" integer unsigned NOT NULL CHECK ("letter_count" >= 0) DEFAULT 0,
+  "character_count" integer unsigned NOT NULL CHECK ("character_count" >= 0) DEFAULT 0
 );
 
 CREATE INDEX "quarters_verse_count_3da85c21" ON "quarters" ("verse_count");
@@ -83,7 +95,10 @@ CREATE TABLE "pages" (
   "chapter_id" bigint NULL REFERENCES "chapters" ("id") DEFERRABLE INITIALLY DEFERRED,
   "group_id" bigint NULL REFERENCES "groups" ("id") DEFERRABLE INITIALLY DEFERRED,
   "part_id" bigint NULL REFERENCES "parts" ("id") DEFERRABLE INITIALLY DEFERRED,
-  "quarter_id" bigint NULL REFERENCES "quarters" ("id") DEFERRABLE INITIALLY DEFERRED
+  "quarter_id" bigint NULL REFERENCES "quarters" ("id") DEFERRABLE INITIALLY DEFERRED,
+  "word_count" integer unsigned NOT NULL CHECK ("word_count" >= 0) DEFAULT 0,
+  "letter_count" integer unsigned NOT NULL CHECK ("letter_count" >= 0) DEFAULT 0,
+  "character_count" integer unsigned NOT NULL CHECK ("character_count" >= 0) DEFAULT 0
 );
 
 CREATE INDEX "pages_verse_count_c0e0d056" ON "pages" ("verse_count");
@@ -0,0 +1,15 @@
+BEGIN;
+
+--
+-- Create model PageText
+--
+DROP TABLE IF EXISTS "page_texts";
+
+CREATE TABLE "page_texts" (
+  "page_id" integer NOT NULL PRIMARY KEY REFERENCES "pages" ("id") DEFERRABLE INITIALLY DEFERRED,
+  "content" text NOT NULL,
+  "offsets" text NOT NULL,
+  "collections" text NULL
+);
+
+COMMIT;
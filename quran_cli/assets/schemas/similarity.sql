@@ -0,0 +1,16 @@
+BEGIN;
+
+--
+-- Create model SimilarVerse
+--
+DROP TABLE IF EXISTS "similar_verses";
+
+CREATE TABLE "similar_verses" (
+  "id" integer NOT NULL PRIMARY KEY AUTOINCREMENT,
+  "rank" smallint unsigned NOT NULL CHECK ("rank" >= 0),
+  "score" real NOT NULL,
+  "verse_id" bigint NOT NULL REFERENCES "verses" ("id") DEFERRABLE INITIALLY DEFERRED,
+  "similar_id" bigint NOT NULL REFERENCES "verses" ("id") DEFERRABLE INITIALLY DEFERRED
+);
+
+COMMIT;
@@ -0,0 +1,16 @@
+BEGIN;
+
+--
+-- Create model Word (Al-Kalimat)
+--
+DROP TABLE IF EXISTS "words";
+
+CREATE TABLE "words" (
+  "id" integer NOT NULL PRIMARY KEY AUTOINCREMENT,
+  "position" smallint unsigned NOT NULL CHECK ("position" >= 0),
+  "content" varchar(64) NOT NULL,
+  "unaccent_content" varchar(64) NOT NULL,
+  "verse_id" bigint NOT NULL REFERENCES "verses" ("id") DEFERRABLE INITIALLY DEFERRED
+);
+
+COMMIT;
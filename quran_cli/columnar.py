@@ -0,0 +1,194 @@
+"""Columnar binary format, a stream of record batches in the spirit of Arrow IPC"""
+
+from array import array
+import struct
+import sys
+from typing import Any, BinaryIO, Iterator, List, Sequence, Tuple
+
+
+# Constants
+MAGIC = b"QCOL\x00\x01"
+
+# Column types of a batch
+NULL, INTEGER, REAL, TEXT, BLOB = range(5)
+
+
+def write_schema(file: BinaryIO, columns: Sequence[str]) -> None:
+    """
+    Writes the stream header, the magic bytes and the column names.
+
+    Args:
+        file (BinaryIO): Output file
+        columns (Sequence[str]): Column names
+    """
+
+    file.write(MAGIC + struct.pack("<I", len(columns)))
+
+    for column in columns:
+        name = column.encode("utf-8")
+        file.write(struct.pack("<I", len(name)) + name)
+
+
+def to_bytes(values: array) -> bytes:
+    """
+    Returns the little-endian bytes of an array.
+
+    Args:
+        values (array): Array
+
+    Returns:
+        bytes: Array data
+    """
+
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def get_type(values: Sequence[Any]) -> int:
+    """
+    Returns the type of a column of a batch, mixed columns are stored as text.
+
+    Args:
+        values (Sequence[Any]): Column values
+
+    Returns:
+        int: Column type
+    """
+
+    types = {type(value) for value in values if value is not None}
+
+    if not types:
+        return NULL
+
+    if types <= {int}:
+        return INTEGER
+
+    if types <= {int, float}:
+        return REAL
+
+    if types == {bytes}:
+        return BLOB
+
+    return TEXT
+
+
+def write_batch(file: BinaryIO, rows: Sequence[Tuple[Any, ...]]) -> None:
+    """
+    Writes a record batch, each column is a type, a validity bitmap and the
+    values, fixed width numbers or offsets followed by the data.
+
+    Args:
+        file (BinaryIO): Output file
+        rows (Sequence[Tuple[Any, ...]]): Rows, at least one
+    """
+
+    file.write(struct.pack("<I", len(rows)))
+
+    for values in zip(*rows):
+        kind = get_type(values)
+
+        bitmap = bytearray((len(values) + 7) // 8)
+        for i, value in enumerate(values):
+            if value is not None:
+                bitmap[i // 8] |= 1 << (i % 8)
+
+        file.write(struct.pack("<B", kind) + bytes(bitmap))
+
+        if kind == INTEGER:
+            file.write(to_bytes(array("q", (v or 0 for v in values))))
+
+        elif kind == REAL:
+            file.write(to_bytes(array("d", (v or 0.0 for v in values))))
+
+        elif kind in (TEXT, BLOB):
+            data = [
+                (
+                    b""
+                    if v is None
+                    else v if isinstance(v, bytes) else str(v).encode("utf-8")
+                )
+                for v in values
+            ]
+            offsets, position = array("I", [0]), 0
+            for item in data:
+                position += len(item)
+                offsets.append(position)
+
+            file.write(to_bytes(offsets) + b"".join(data))
+
+
+def write_end(file: BinaryIO) -> None:
+    """
+    Writes the end of stream marker, an empty batch.
+
+    Args:
+        file (BinaryIO): Output file
+    """
+
+    file.write(struct.pack("<I", 0))
+
+
+def read_batches(file: BinaryIO) -> Iterator[Tuple[List[str], List[Tuple[Any, ...]]]]:
+    """
+    Reads a stream written by `write_schema`, `write_batch` and `write_end`.
+
+    Args:
+        file (BinaryIO): Input file
+
+    Returns:
+        Iterator[Tuple[List[str], List[Tuple[Any, ...]]]]: Column names and rows of
+        each batch
+    """
+
+    def read(size: int) -> bytes:
+        data = file.read(size)
+        if len(data) != size:
+            raise ValueError("Truncated columnar stream")
+
+        return data
+
+    def read_array(code: str, count: int) -> array:
+        values = array(code)
+        values.frombytes(read(values.itemsize * count))
+        if sys.byteorder == "big":
+            values.byteswap()
+
+        return values
+
+    if read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a columnar stream")
+
+    columns = [
+        read(struct.unpack("<I", read(4))[0]).decode("utf-8")
+        for _ in range(struct.unpack("<I", read(4))[0])
+    ]
+
+    while count := struct.unpack("<I", read(4))[0]:
+        data = []
+
+        for _ in columns:
+            kind = read(1)[0]
+            bitmap = read((count + 7) // 8)
+            valid = [bool(bitmap[i // 8] >> (i % 8) & 1) for i in range(count)]
+
+            if kind == INTEGER:
+                values = list(read_array("q", count))
+
+            elif kind == REAL:
+                values = list(read_array("d", count))
+
+            elif kind in (TEXT, BLOB):
+                offsets = read_array("I", count + 1)
+                blob = read(offsets[-1])
+                values = [blob[offsets[i] : offsets[i + 1]] for i in range(count)]
+                if kind == TEXT:
+                    values = [value.decode("utf-8") for value in values]
+
+            else:
+                values = [None] * count
+
+            data.append([v if ok else None for v, ok in zip(values, valid)])
+
+        yield columns, list(zip(*data))
@@ -1,12 +1,35 @@
 """Quran CLI Commands"""
 
+from quran_cli.commands.build import build
 from quran_cli.commands.clear import clear
+from quran_cli.commands.concordance import concordance
 from quran_cli.commands.explore import explore
 from quran_cli.commands.export import export
+from quran_cli.commands.index import index
 from quran_cli.commands.init import init
 from quran_cli.commands.interpret import interpret
+from quran_cli.commands.loadtest import loadtest
 from quran_cli.commands.normalize import normalize
+from quran_cli.commands.query import query
+from quran_cli.commands.similar import similar
+from quran_cli.commands.synthesize import synthesize
+from quran_cli.commands.verify import verify
 
 
 # Add your commands here
-command_list = [clear, explore, export, init, interpret, normalize]
+command_list = [
+    build,
+    clear,
+    concordance,
+    explore,
+    export,
+    index,
+    init,
+    interpret,
+    loadtest,
+    normalize,
+    query,
+    similar,
+    synthesize,
+    verify,
+]
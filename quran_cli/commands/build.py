@@ -0,0 +1,171 @@
+"""Build command"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+import os
+from pathlib import Path
+import sqlite3
+import tempfile
+import time
+from typing import Annotated, Dict, List, Tuple
+import typer
+from rich import print
+
+from quran_cli import utils
+from quran_cli.similarity import require_numpy
+
+
+# Constants
+FLAGS = ("diacritics", "interpret", "words", "pages", "similarity")
+
+
+def parse_variant(variant: str) -> Tuple[Path, Dict[str, bool]]:
+    """
+    Parses a variant specification, `FILE[=FLAG,FLAG...]`.
+
+    Args:
+        variant (str): Variant specification
+
+    Returns:
+        Tuple[Path, Dict[str, bool]]: Database file and flags
+    """
+
+    name, _, flags = variant.partition("=")
+    flags = [flag.strip() for flag in flags.split(",") if flag.strip()]
+
+    for flag in flags:
+        if flag not in FLAGS:
+            raise typer.BadParameter(
+                f"Unknown flag {flag!r} in {variant!r}, expected one of {', '.join(FLAGS)}"
+            )
+
+    return Path(utils.get_database_name(Path(name))), {
+        flag: flag in flags for flag in FLAGS
+    }
+
+
+def build_variant(
+    staging: str,
+    shards: Dict[str, str],
+    database: Path,
+    diacritics: bool,
+    interpret: bool,
+    words: bool,
+    pages: bool,
+    similarity: bool,
+) -> Tuple[Path, float]:
+    """
+    Builds one variant in memory from the staging database and publishes it.
+
+    Args:
+        staging (str): Staging database file
+        shards (Dict[str, str]): Shard database file of each collection asset
+        database (Path): Output database file
+        diacritics (bool): Weather to include Arabic diacritics in chapter names
+        interpret (bool): Weather to add interpretations and translations
+        words (bool): Weather to build the words (concordance) table
+        pages (bool): Weather to build the page_texts table
+        similarity (bool): Weather to compute the similar verses
+
+    Returns:
+        Tuple[Path, float]: Database file and build time in seconds
+    """
+
+    start = time.perf_counter()
+    connection = sqlite3.connect(":memory:")
+
+    with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+        source = sqlite3.connect(staging)
+        source.backup(connection)
+        source.close()
+
+        cursor = connection.cursor()
+        utils.normalize_database(cursor, diacritics, words=words)
+
+        if interpret:
+            utils.merge_collection_shards(cursor, shards)
+
+        if pages:
+            utils.insert_page_texts(cursor, collections=interpret)
+
+        if similarity:
+            utils.insert_similar_verses(cursor)
+
+        utils.execute_sql_script(cursor, 'DROP TABLE "quran";\nVACUUM;')
+        connection.commit()
+
+    utils.publish_database(connection, database)
+    connection.close()
+
+    return database, time.perf_counter() - start
+
+
+def build(
+    variants: Annotated[
+        List[str],
+        typer.Option(
+            "-v",
+            "--variant",
+            help="Variant to build as FILE[=FLAG,FLAG...], "
+            "flags: diacritics, interpret, words, pages, similarity. Can be repeated",
+        ),
+    ],
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "-j",
+            "--jobs",
+            min=1,
+            help="Number of variants to build concurrently [default: CPU count]",
+        ),
+    ] = os.cpu_count() or 1,
+) -> None:
+    """
+    Build several database variants from a single parse of the assets.
+
+    Each variant is a full init, normalize and interpret run, built in memory in
+    its own process and published atomically, without the staging `quran` table.
+
+    Examples:
+
+    ```bash
+    quran-cli build -v quran.sqlite3 -v quran-full.sqlite3=diacritics,interpret
+    ```
+    """
+
+    try:
+        matrix = [parse_variant(variant) for variant in variants]
+        start = time.perf_counter()
+
+        if any(flags["similarity"] for _, flags in matrix):
+            require_numpy()
+
+        with tempfile.TemporaryDirectory() as directory:
+            staging = os.path.join(directory, "staging.sqlite3")
+
+            print("Parsing [bold]assets[/bold]...")
+            with utils.open_database(Path(staging)) as connection:
+                cursor = connection.cursor()
+                utils.apply_initial_schema(cursor)
+                utils.insert_initial_data(cursor)
+
+            shards = utils.load_collection_shards(directory, jobs)
+
+            print(f"Building [bold]{len(matrix)}[/bold] variants...")
+            with ProcessPoolExecutor(min(jobs, len(matrix))) as executor:
+                futures = [
+                    executor.submit(build_variant, staging, shards, database, **flags)
+                    for database, flags in matrix
+                ]
+
+                for future in as_completed(futures):
+                    database, elapsed = future.result()
+                    print(f"    - [bold]{database}[/bold]... Done ({elapsed:.2f}s)")
+
+        print(
+            f"Build [bold green]completed[/bold green] "
+            f"in {time.perf_counter() - start:.2f}s."
+        )
+
+    except Exception as error:
+        print(f"[bold red]Error[/bold red]: {error}")
@@ -0,0 +1,116 @@
+"""Concordance command"""
+
+from enum import Enum
+from pathlib import Path
+import sqlite3
+from typing import Annotated, Optional
+import typer
+from rich import box, print
+from rich.table import Table
+
+from quran_cli import utils
+
+
+class Unit(str, Enum):
+    """Units to count word frequency by"""
+
+    CHAPTER = "chapter"
+    PART = "part"
+    GROUP = "group"
+    QUARTER = "quarter"
+    PAGE = "page"
+
+
+def concordance(
+    database: Annotated[
+        Path,
+        typer.Argument(exists=True, dir_okay=False, help="Database file"),
+    ],
+    word: Annotated[str, typer.Argument(help="Word to look up")],
+    exact: Annotated[
+        bool,
+        typer.Option(
+            "-e",
+            "--exact",
+            help="Weather to match the word with its diacritics",
+        ),
+    ] = False,
+    by: Annotated[
+        Optional[Unit],
+        typer.Option(
+            "-b",
+            "--by",
+            help="Count the occurrences per unit instead of listing them",
+        ),
+    ] = None,
+) -> None:
+    """
+    Look up every occurrence of a word in the Quran.
+
+    Notes:
+        Requires the words table, see `quran-cli normalize --with-words`.
+
+    Examples:
+
+    ```bash
+    quran-cli init db.sqlite3
+    quran-cli normalize -w db.sqlite3
+
+    quran-cli concordance db.sqlite3 الرحمن
+    quran-cli concordance db.sqlite3 الرحمن -b chapter
+    ```
+    """
+
+    try:
+        connection = sqlite3.connect(database)
+        cursor = connection.cursor()
+
+        field, value = (
+            ("content", word) if exact else ("unaccent_content", utils.unaccent(word))
+        )
+
+        if by:
+            title = f"Occurrences per {by.value}"
+            columns = [by.value.capitalize(), "Occurrences"]
+            results = cursor.execute(
+                f'SELECT "verses"."{by.value}_id", COUNT(*) FROM "words" '
+                'INNER JOIN "verses" ON ("words"."verse_id" = "verses"."id") '
+                f'WHERE "words"."{field}" = ? GROUP BY "verses"."{by.value}_id" '
+                f'ORDER BY "verses"."{by.value}_id"',
+                (value,),
+            ).fetchall()
+
+        else:
+            title = "Occurrences"
+            columns = ["Chapter", "Verse", "Position", "Word"]
+            results = cursor.execute(
+                'SELECT "verses"."chapter_id", "verses"."number", "words"."position", '
+                '"words"."content" FROM "words" '
+                'INNER JOIN "verses" ON ("words"."verse_id" = "verses"."id") '
+                f'WHERE "words"."{field}" = ? ORDER BY "words"."verse_id", '
+                '"words"."position"',
+                (value,),
+            ).fetchall()
+
+        connection.close()
+
+        table = Table(
+            title=title,
+            title_justify="left",
+            title_style="bold",
+            caption=f"{sum(r[-1] for r in results) if by else len(results)} occurrences",
+            caption_justify="left",
+            box=box.ROUNDED,
+            highlight=True,
+        )
+
+        for column in columns:
+            table.add_column(column)
+
+        for row in results:
+            table.add_row(*[str(item) for item in row])
+
+        print(table)
+
+    except Exception as error:
+        print(f"[bold red]Error[/bold red]: {error}")
@@ -1,14 +1,356 @@
 """JSON Export command"""
 
+import csv
+from enum import Enum
+from itertools import groupby
 import json
 import os
+import re
 import sqlite3
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Tuple
 import typer
 from rich import print
 
-from quran_cli import TABLE_FIELDS
+from quran_cli import TABLE_FIELDS, memory, utils
+
+
+# Constants
+PAGE_TEXT_FIELDS = ["page_id", "content", "offsets", "collections"]
+PARALLEL_FIELDS = ["id", "chapter_id", "number", "content", "page_id"]
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+POSTGRES_TYPES = {
+    "integer": "bigint",
+    "bigint": "bigint",
+    "smallint unsigned": "smallint",
+    "integer unsigned": "integer",
+    "bool": "boolean",
+    "text": "text",
+}
+# SQLite does not enforce declared lengths, the data may not fit them
+CHARACTER_TYPE = re.compile(r"^(?:var)?char\s*\(\s*\d+\s*\)$")
+
+
+class Format(str, Enum):
+    """Export formats"""
+
+    JSON = "json"
+    NDJSON = "ndjson"
+    CSV = "csv"
+    POSTGRES = "postgres"
+
+
+def to_copy_value(value: Any) -> str:
+    """
+    Converts a value to PostgreSQL COPY text format.
+
+    Args:
+        value (Any): Column value
+
+    Returns:
+        str: Escaped value, `\\N` for NULL
+    """
+
+    if value is None:
+        return "\\N"
+
+    return str(value).translate(COPY_ESCAPES)
+
+
+def get_postgres_schema(
+    connection: sqlite3.Connection, name: str
+) -> Tuple[str, List[str]]:
+    """
+    Translates a table's SQLite schema into PostgreSQL DDL.
+
+    Args:
+        connection (sqlite3.Connection): Database connection
+        name (str): Table name
+
+    Returns:
+        Tuple[str, List[str]]: The CREATE TABLE statement and the deferred
+        statements (indexes, foreign keys and identity sequence) to run after loading
+    """
+
+    types, columns = {}, []
+    for _, column, kind, not_null, default, pk in connection.execute(
+        f'PRAGMA table_info("{name}")'
+    ).fetchall():
+        types[column] = kind = kind.lower()
+
+        # The id is the key, the other columns of a clustered key are plain ones
+        if pk and column == "id":
+            columns.append(
+                f'  "{column}" bigint GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY'
+            )
+            continue
+
+        kind = "text" if CHARACTER_TYPE.match(kind) else POSTGRES_TYPES.get(kind, kind)
+        definition = f'  "{column}" {kind}'
+        if not_null:
+            definition += " NOT NULL"
+        if default is not None:
+            definition += f" DEFAULT {default}"
+
+        columns.append(definition)
+
+    deferred = []
+    for _, index, unique, origin, _ in connection.execute(
+        f'PRAGMA index_list("{name}")'
+    ).fetchall():
+        fields = [
+            row[2]
+            for row in connection.execute(f'PRAGMA index_info("{index}")').fetchall()
+        ]
+        # The id is the primary key of the PostgreSQL table already
+        if origin == "pk" or fields == ["id"]:
+            continue
+
+        if origin == "u":
+            index = f"{name}_{'_'.join(fields)}_key"
+
+        # B-tree entries are size limited in PostgreSQL, long text is hashed instead
+        method = (
+            " USING hash"
+            if not unique and len(fields) == 1 and types[fields[0]] == "text"
+            else ""
+        )
+        fields = ", ".join(f'"{field}"' for field in fields)
+
+        deferred.append(
+            f'CREATE {"UNIQUE " if unique else ""}INDEX "{index}" '
+            f'ON "{name}"{method} ({fields});\n'
+        )
+
+    for row in connection.execute(f'PRAGMA foreign_key_list("{name}")'):
+        deferred.append(
+            f'ALTER TABLE "{name}" ADD FOREIGN KEY ("{row[3]}") '
+            f'REFERENCES "{row[2]}" ("{row[4]}") DEFERRABLE INITIALLY DEFERRED;\n'
+        )
+
+    deferred.append(
+        f"SELECT setval(pg_get_serial_sequence('\"{name}\"', 'id'), "
+        f'COALESCE(MAX("id"), 0) + 1, false) FROM "{name}";\n'
+    )
+
+    columns = ",\n".join(columns)
+
+    return (
+        f'DROP TABLE IF EXISTS "{name}" CASCADE;\n'
+        f'CREATE TABLE "{name}" (\n{columns}\n);\n',
+        deferred,
+    )
+
+
+def export_json(
+    connection: sqlite3.Connection, output: Path, name: str, fields: Dict[int, str]
+) -> None:
+    """
+    Exports a table to a JSON file, one batch of rows at a time.
+
+    Args:
+        connection (sqlite3.Connection): Database connection
+        output (Path): Output folder
+        name (str): Table name
+        fields (Dict[int, str]): Table fields
+    """
+
+    write_rows(
+        os.path.join(output, name),
+        Format.JSON,
+        list(fields.values()),
+        utils.fetch_rows(connection.execute(f'SELECT * FROM "{name}"')),
+    )
+
+
+def write_rows(
+    path: str, output_format: Format, columns: List[str], rows: Iterable[Any]
+) -> None:
+    """
+    Streams rows to a JSON, NDJSON or CSV file.
+
+    Args:
+        path (str): Output file, without extension
+        output_format (Format): Output format
+        columns (List[str]): Column names
+        rows (Iterable[Any]): Rows
+    """
+
+    with open(
+        f"{path}.{output_format.value}",
+        mode="w",
+        encoding="utf-8",
+        newline="" if output_format == Format.CSV else "\n",
+    ) as file:
+        if output_format == Format.CSV:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            writer.writerows(rows)
+            return
+
+        separator = ""
+        if output_format == Format.JSON:
+            file.write("[")
+
+        for row in rows:
+            data = json.dumps(
+                dict(zip(columns, row)),
+                ensure_ascii=False,
+                indent=2 if output_format == Format.JSON else None,
+            )
+
+            if output_format == Format.JSON:
+                file.write(f"{separator}\n  " + data.replace("\n", "\n  "))
+                separator = ","
+
+            else:
+                file.write(data + "\n")
+
+        if output_format == Format.JSON:
+            file.write("\n]" if separator else "]")
+
+
+def get_parallel_query(connection: sqlite3.Connection) -> Tuple[str, List[str]]:
+    """
+    Builds the pivot query returning one row per verse with a column per collection.
+
+    Args:
+        connection (sqlite3.Connection): Database connection
+
+    Returns:
+        Tuple[str, List[str]]: The query, in verse order, and its column names
+    """
+
+    collections = [
+        row[0]
+        for row in connection.execute('SELECT "id" FROM "collections" ORDER BY "id"')
+    ]
+
+    pivot = "".join(
+        f', GROUP_CONCAT(CASE WHEN "items"."collection_id" = {collection} '
+        f'THEN "items"."content" END, char(10)) AS "collection_{collection}"'
+        for collection in collections
+    )
+    fields = ", ".join(f'"verses"."{field}"' for field in PARALLEL_FIELDS)
+
+    return (
+        f'SELECT {fields}{pivot} FROM "verses" '
+        'LEFT JOIN "items" ON ("items"."verse_id" = "verses"."id") '
+        'GROUP BY "verses"."id" ORDER BY "verses"."id"',
+        PARALLEL_FIELDS + [f"collection_{collection}" for collection in collections],
+    )
+
+
+@memory.track
+def export_parallel(
+    connection: sqlite3.Connection,
+    output: Path,
+    output_format: Format,
+    by_chapter: bool,
+) -> None:
+    """
+    Exports the verses aligned with every collection, one row per verse, from a
+    single streaming query.
+
+    Args:
+        connection (sqlite3.Connection): Database connection
+        output (Path): Output folder
+        output_format (Format): Output format, json, ndjson or csv
+        by_chapter (bool): Weather to write one file per chapter
+    """
+
+    query, columns = get_parallel_query(connection)
+    rows = utils.fetch_rows(
+        connection.execute(query),
+        utils.ROW_BYTES * (1 + len(columns) - len(PARALLEL_FIELDS)),
+    )
+
+    if not by_chapter:
+        write_rows(os.path.join(output, "parallel"), output_format, columns, rows)
+        return
+
+    os.makedirs(os.path.join(output, "parallel"), exist_ok=True)
+
+    for chapter_id, chapter in groupby(rows, key=lambda row: row[1]):
+        write_rows(
+            os.path.join(output, "parallel", f"{chapter_id:03}"),
+            output_format,
+            columns,
+            chapter,
+        )
+
+
+@memory.track
+def export_page_texts(
+    connection: sqlite3.Connection, output: Path, output_format: Format
+) -> None:
+    """
+    Exports the page_texts table, one file per page.
+
+    Args:
+        connection (sqlite3.Connection): Database connection
+        output (Path): Output folder
+        output_format (Format): Output format, json, ndjson or csv
+    """
+
+    os.makedirs(os.path.join(output, "pages"), exist_ok=True)
+    fields = ", ".join(f'"{field}"' for field in PAGE_TEXT_FIELDS)
+
+    for row in connection.execute(
+        f'SELECT {fields} FROM "page_texts" ORDER BY "page_id"'
+    ):
+        page = dict(zip(PAGE_TEXT_FIELDS, row))
+        page["offsets"] = json.loads(page["offsets"])
+        page["collections"] = json.loads(page["collections"] or "null")
+
+        if output_format == Format.JSON:
+            with open(
+                os.path.join(output, "pages", f"{row[0]:03}.json"),
+                mode="w",
+                encoding="utf-8",
+            ) as file:
+                json.dump(page, file, indent=2, ensure_ascii=False)
+
+        else:
+            write_rows(
+                os.path.join(output, "pages", f"{row[0]:03}"),
+                output_format,
+                PAGE_TEXT_FIELDS,
+                [row if output_format == Format.CSV else list(page.values())],
+            )
+
+
+def export_postgres(
+    connection: sqlite3.Connection, output: Path, position: int, name: str
+) -> None:
+    """
+    Exports a table to a psql script with a `COPY ... FROM STDIN` text-format block.
+
+    Args:
+        connection (sqlite3.Connection): Database connection
+        output (Path): Output folder
+        position (int): Position of the table in the load order
+        name (str): Table name
+    """
+
+    fields = ", ".join(f'"{field}"' for field in TABLE_FIELDS[name].values())
+
+    with open(
+        os.path.join(output, f"{position:02}-{name}.sql"),
+        mode="w",
+        encoding="utf-8",
+        newline="\n",
+    ) as file:
+        file.write(f'COPY "{name}" ({fields}) FROM STDIN;\n')
+
+        file.writelines(
+            "\t".join(to_copy_value(value) for value in row) + "\n"
+            for row in utils.fetch_rows(
+                connection.execute(f'SELECT {fields} FROM "{name}" ORDER BY "id"')
+            )
+        )
+
+        file.write("\\.\n")
 
 
 def export(
@@ -26,9 +368,64 @@ def export(
             help="Output folder",
         ),
     ] = Path("json"),
+    output_format: Annotated[
+        Format,
+        typer.Option(
+            "-f",
+            "--format",
+            help="Output format",
+        ),
+    ] = Format.JSON,
+    parallel: Annotated[
+        bool,
+        typer.Option(
+            "-p",
+            "--parallel",
+            help="Weather to export one row per verse with a column per collection",
+        ),
+    ] = False,
+    by_chapter: Annotated[
+        bool,
+        typer.Option(
+            "-c",
+            "--by-chapter",
+            help="Weather to write the parallel text in one file per chapter",
+        ),
+    ] = False,
+    page_texts: Annotated[
+        bool,
+        typer.Option(
+            "-t",
+            "--page-texts",
+            help="Weather to export the page texts, one file per page",
+        ),
+    ] = False,
+    max_memory: Annotated[
+        Optional[str],
+        typer.Option(
+            "-M",
+            "--max-memory",
+            help="Memory budget to size the chunks of work for, e.g. 256M or 1G",
+        ),
+    ] = None,
+    memory_report: Annotated[
+        bool,
+        typer.Option(
+            "-r",
+            "--memory-report",
+            help="Weather to report the peak memory of each step",
+        ),
+    ] = False,
 ) -> None:
     """
-    Export Quran data to json.
+    Export Quran data to json, ndjson, csv or PostgreSQL COPY files.
+
+    The postgres format writes `00-schema.sql`, one `COPY ... FROM STDIN` file
+    per table in dependency order, `99-indexes.sql` with the deferred indexes and
+    constraints, and `load.sql` to run them all in one pass.
+
+    The parallel text has the verse fields and a `collection_<id>` column with
+    the items of each collection, described in the collections file next to it.
 
     Examples:
 
@@ -42,40 +439,114 @@ def export(
     # Export normalized database
     quran-cli export db.sqlite3
     quran-cli export db.sqlite3 -o data
+
+    # Export for PostgreSQL, then load with psql
+    quran-cli export db.sqlite3 -f postgres -o pg
+    psql -1 -f pg/load.sql
+
+    # Assembled page texts, one file per page
+    quran-cli export db.sqlite3 -t -o pages
+
+    # Verses with every collection, one NDJSON file per chapter
+    quran-cli export db.sqlite3 -p -c -f ndjson -o parallel
+
+    # Stay within 64 MiB and report the peak memory of each table
+    quran-cli export db.sqlite3 -M 64M -r
     ```
     """
 
     try:
-        connection = sqlite3.connect(database)
-        os.makedirs(output, exist_ok=True)
+        with memory.monitor(max_memory, memory_report):
+            connection = sqlite3.connect(database)
+            memory.configure_connection(connection)
+            os.makedirs(output, exist_ok=True)
 
-        print(f"Exporting [bold]{database}[/bold]:")
+            if (parallel or page_texts) and output_format == Format.POSTGRES:
+                raise ValueError("Only tables can be exported to postgres")
 
-        for name, fields in TABLE_FIELDS.items():
-            print(f"    - [bold]{name}[/bold] table...", end=" ")
+            if page_texts:
+                print(
+                    f"Exporting the page texts of [bold]{database}[/bold]...", end=" "
+                )
 
-            with open(
-                f"{os.path.join(output, name)}.json",
-                mode="w",
-                encoding="utf-8",
-            ) as file:
-                json.dump(
-                    [
-                        {fields[k]: v for k, v in list(enumerate(row))}
-                        for row in connection.cursor()
-                        .execute(f'SELECT * FROM "{name}"')
-                        .fetchall()
-                    ],
-                    file,
-                    indent=2,
-                    ensure_ascii=False,
+                export_page_texts(connection, output, output_format)
+
+                print("[bold green]Done[/bold green]")
+
+            if parallel:
+                print(
+                    f"Exporting the parallel text of [bold]{database}[/bold]...",
+                    end=" ",
+                )
+
+                export_parallel(connection, output, output_format, by_chapter)
+                write_rows(
+                    os.path.join(output, "collections"),
+                    output_format,
+                    list(TABLE_FIELDS["collections"].values()),
+                    connection.execute('SELECT * FROM "collections" ORDER BY "id"'),
+                )
+
+                print("[bold green]Done[/bold green]")
+
+            if parallel or page_texts:
+                connection.close()
+                return
+
+            print(f"Exporting [bold]{database}[/bold]:")
+
+            schema, deferred = [], []
+            for position, (name, fields) in enumerate(TABLE_FIELDS.items(), start=1):
+                print(f"    - [bold]{name}[/bold] table...", end=" ")
+
+                with memory.step(name):
+                    if output_format == Format.POSTGRES:
+                        table, statements = get_postgres_schema(connection, name)
+                        schema.append(table)
+                        deferred.extend(statements)
+                        export_postgres(connection, output, position, name)
+
+                    elif output_format == Format.JSON:
+                        export_json(connection, output, name, fields)
+
+                    else:
+                        write_rows(
+                            os.path.join(output, name),
+                            output_format,
+                            list(fields.values()),
+                            utils.fetch_rows(
+                                connection.execute(
+                                    f'SELECT * FROM "{name}" ORDER BY "id"'
+                                )
+                            ),
+                        )
+
+                print("[bold green]Done[/bold green]")
+
+            if output_format == Format.POSTGRES:
+                files = {"00-schema.sql": "".join(schema)}
+                files["99-indexes.sql"] = "".join(deferred) + "ANALYZE;\n"
+                files["load.sql"] = "".join(
+                    f"\\ir {file}\n"
+                    for file in [
+                        "00-schema.sql",
+                        *[
+                            f"{position:02}-{name}.sql"
+                            for position, name in enumerate(TABLE_FIELDS, start=1)
+                        ],
+                        "99-indexes.sql",
+                    ]
                 )
 
-            print("[bold green]Done[/bold green]")
+                for file, content in files.items():
+                    with open(
+                        os.path.join(output, file), "w", encoding="utf-8", newline="\n"
+                    ) as f:
+                        f.write(content)
 
-        connection.close()
+            connection.close()
 
-        print("Export [bold green]completed[/bold green].")
+            print("Export [bold green]completed[/bold green].")
 
     except Exception as error:
         print(f"[bold red]Error[/bold red]: {error}")
@@ -0,0 +1,394 @@
+"""Index command"""
+
+from enum import Enum
+import os
+from pathlib import Path
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from typing import Annotated, Dict, List, Optional, Tuple
+import typer
+from rich import box, print
+from rich.table import Table
+
+from quran_cli import utils
+
+
+# Representative read queries, with a function returning random parameters
+QUERIES = {
+    "verse by chapter and number": (
+        'SELECT * FROM "verses" WHERE "chapter_id" = ? AND "number" = ?',
+        lambda: (random.randint(1, 114), 1),
+    ),
+    "verses of a page": (
+        'SELECT * FROM "verses" WHERE "page_id" = ? ORDER BY "id"',
+        lambda: (random.randint(1, 604),),
+    ),
+    "verses of a quarter": (
+        'SELECT * FROM "verses" WHERE "quarter_id" = ? ORDER BY "id"',
+        lambda: (random.randint(1, 240),),
+    ),
+    "items of a verse in a collection": (
+        'SELECT * FROM "items" WHERE "verse_id" = ? AND "collection_id" = ?',
+        lambda: (random.randint(1, 6236), random.randint(1, 3)),
+    ),
+    "page with translation": (
+        'SELECT "verses"."number", "verses"."content", "items"."content" '
+        'FROM "verses" INNER JOIN "items" ON ("items"."verse_id" = "verses"."id") '
+        'WHERE "verses"."page_id" = ? AND "items"."collection_id" = ?',
+        lambda: (random.randint(1, 604), 2),
+    ),
+    "collection in verse order": (
+        'SELECT "content" FROM "items" WHERE "collection_id" = ? ORDER BY "verse_id"',
+        lambda: (random.randint(1, 3),),
+    ),
+    "word lookup": (
+        'SELECT "verse_id", "position" FROM "words" WHERE "unaccent_content" = ?',
+        lambda: (random.choice(["الله", "الرحمن", "قال", "موسى"]),),
+    ),
+    "verses per part": (
+        'SELECT "part_id", COUNT(*) FROM "verses" GROUP BY "part_id"',
+        lambda: (),
+    ),
+}
+
+
+# Queries of the items layout benchmark
+LAYOUT_QUERIES = [
+    "items of a verse in a collection",
+    "page with translation",
+    "collection in verse order",
+]
+
+
+class Profile(str, Enum):
+    """Index profiles"""
+
+    DJANGO = "django"
+    READER = "reader"
+    ANALYTICS = "analytics"
+    MINIMAL = "minimal"
+
+
+class Layout(str, Enum):
+    """Items layouts"""
+
+    ROWID = "rowid"
+    CLUSTERED = "clustered"
+
+
+def get_read_bytes() -> Optional[int]:
+    """
+    Returns the number of bytes read by this process, including reads served
+    by the page cache of the operating system (Linux only).
+
+    Returns:
+        Optional[int]: Bytes read, None if unavailable
+    """
+
+    try:
+        with open("/proc/self/io", "r", encoding="utf-8") as file:
+            for line in file:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+
+    except OSError:
+        pass
+
+    return None
+
+
+def benchmark_layout(
+    database: Path, layout: str, iterations: int
+) -> Tuple[int, Dict[str, Tuple[float, Optional[float]]]]:
+    """
+    Applies an items layout to a copy of a database and times the items queries,
+    each run on a new connection, with an empty page cache.
+
+    Args:
+        database (Path): Database file
+        layout (str): Items layout
+        iterations (int): Number of runs of each query
+
+    Returns:
+        Tuple[int, Dict[str, Tuple[float, Optional[float]]]]: Database size in
+        bytes, the median latency of each query in microseconds and the mean
+        number of KiB read from the file, None if unavailable
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "layout.sqlite3")
+        shutil.copyfile(database, path)
+
+        connection = sqlite3.connect(path)
+        cursor = connection.cursor()
+        utils.apply_items_layout(cursor, layout)
+        utils.execute_sql_script(cursor, "VACUUM;")
+        connection.close()
+
+        size = os.path.getsize(path)
+
+        random.seed(0)
+        results: Dict[str, Tuple[float, Optional[float]]] = {}
+        for name in LAYOUT_QUERIES:
+            query, params = QUERIES[name]
+            timings, reads = [], []
+
+            for _ in range(iterations):
+                args = params()
+                connection = sqlite3.connect(path)
+                connection.execute("SELECT 1 FROM \"sqlite_master\"").fetchall()
+
+                before = get_read_bytes()
+                start = time.perf_counter()
+                connection.execute(query, args).fetchall()
+                timings.append(time.perf_counter() - start)
+                after = get_read_bytes()
+
+                connection.close()
+                if before is not None and after is not None:
+                    reads.append(after - before)
+
+            results[name] = (
+                statistics.median(timings) * 1e6,
+                statistics.mean(reads) / 1024 if reads else None,
+            )
+
+    return size, results
+
+
+def benchmark_profile(
+    database: Path, profile: str, iterations: int
+) -> Tuple[int, Dict[str, Optional[float]]]:
+    """
+    Applies a profile to an in-memory copy of a database and times the
+    representative queries.
+
+    Args:
+        database (Path): Database file
+        profile (str): Index profile
+        iterations (int): Number of runs of each query
+
+    Returns:
+        Tuple[int, Dict[str, Optional[float]]]: Database size in bytes and the
+        median latency of each query in microseconds, None if it can not run
+    """
+
+    connection = sqlite3.connect(":memory:")
+    source = sqlite3.connect(database)
+    source.backup(connection)
+    source.close()
+
+    cursor = connection.cursor()
+    utils.apply_index_profile(cursor, profile)
+    utils.execute_sql_script(cursor, "VACUUM;")
+
+    size = (
+        cursor.execute("PRAGMA page_count").fetchone()[0]
+        * cursor.execute("PRAGMA page_size").fetchone()[0]
+    )
+
+    random.seed(0)
+    latencies: Dict[str, Optional[float]] = {}
+    for name, (query, params) in QUERIES.items():
+        try:
+            cursor.execute(query, params()).fetchall()
+
+        except sqlite3.OperationalError:
+            latencies[name] = None
+            continue
+
+        timings = []
+        for _ in range(iterations):
+            args = params()
+            start = time.perf_counter()
+            cursor.execute(query, args).fetchall()
+            timings.append(time.perf_counter() - start)
+
+        latencies[name] = statistics.median(timings) * 1e6
+
+    connection.close()
+
+    return size, latencies
+
+
+def get_tables(database: Path) -> List[str]:
+    """
+    Lists the tables of a database.
+
+    Args:
+        database (Path): Database file
+
+    Returns:
+        List[str]: Table names
+    """
+
+    connection = sqlite3.connect(database)
+    tables = [
+        row[0]
+        for row in connection.execute(
+            'SELECT "name" FROM "sqlite_master" WHERE "type" = \'table\''
+        )
+    ]
+    connection.close()
+
+    return tables
+
+
+def index(
+    database: Annotated[
+        Path,
+        typer.Argument(exists=True, dir_okay=False, help="Database file"),
+    ],
+    profile: Annotated[
+        Optional[Profile],
+        typer.Option(
+            "-p",
+            "--profile",
+            help="Index profile to apply",
+        ),
+    ] = None,
+    benchmark: Annotated[
+        bool,
+        typer.Option(
+            "-b",
+            "--benchmark",
+            help="Weather to benchmark every profile on an in-memory copy",
+        ),
+    ] = False,
+    layout: Annotated[
+        Optional[Layout],
+        typer.Option(
+            "-l",
+            "--layout",
+            help="Storage layout of the items table to apply",
+        ),
+    ] = None,
+    iterations: Annotated[
+        int,
+        typer.Option(
+            "-n",
+            "--iterations",
+            min=1,
+            help="Number of runs of each benchmark query",
+        ),
+    ] = 200,
+) -> None:
+    """
+    Apply an index profile or an items layout, or benchmark them.
+
+    Profiles: django (the schema defaults), reader (navigation and items of a
+    verse), analytics (reader plus collection scans, joins and word lookups) and
+    minimal (constraints only).
+
+    Layouts: rowid (insertion order, the default) and clustered (a WITHOUT ROWID
+    table ordered by collection and verse, apply it after loading the items).
+
+    Examples:
+
+    ```bash
+    # Compare the profiles on this database
+    quran-cli index db.sqlite3 -b
+
+    # Apply the reader profile
+    quran-cli index db.sqlite3 -p reader
+
+    # Cluster the items by collection and verse
+    quran-cli index db.sqlite3 -l clustered
+    ```
+    """
+
+    try:
+        if benchmark:
+            print(f"Benchmarking index profiles on [bold]{database}[/bold]...")
+
+            results: List[Tuple[str, int, Dict[str, Optional[float]]]] = []
+            for item in Profile:
+                results.append(
+                    (item.value, *benchmark_profile(database, item.value, iterations))
+                )
+
+            table = Table(
+                title=f"Median latency (µs) over {iterations} runs",
+                title_justify="left",
+                title_style="bold",
+                box=box.ROUNDED,
+                highlight=True,
+            )
+            table.add_column("Query")
+            for name, *_ in results:
+                table.add_column(name, justify="right")
+
+            table.add_row(
+                "file size (KiB)", *[f"{size / 1024:,.0f}" for _, size, _ in results]
+            )
+            for query in QUERIES:
+                table.add_row(
+                    query,
+                    *[
+                        "-" if latencies[query] is None else f"{latencies[query]:,.1f}"
+                        for _, _, latencies in results
+                    ],
+                )
+
+            print(table)
+
+            if "items" in get_tables(database):
+                layouts = [
+                    (item.value, *benchmark_layout(database, item.value, iterations))
+                    for item in Layout
+                ]
+
+                table = Table(
+                    title="Items layouts, median latency (µs) / mean KiB read "
+                    "on a new connection",
+                    title_justify="left",
+                    title_style="bold",
+                    box=box.ROUNDED,
+                    highlight=True,
+                )
+                table.add_column("Query")
+                for name, *_ in layouts:
+                    table.add_column(name, justify="right")
+
+                table.add_row(
+                    "file size (KiB)",
+                    *[f"{size / 1024:,.0f}" for _, size, _ in layouts],
+                )
+                for query in LAYOUT_QUERIES:
+                    table.add_row(
+                        query,
+                        *[
+                            f"{timings[query][0]:,.1f} / "
+                            + (
+                                "-"
+                                if timings[query][1] is None
+                                else f"{timings[query][1]:,.1f}"
+                            )
+                            for _, _, timings in layouts
+                        ],
+                    )
+
+                print(table)
+
+        if profile:
+            with utils.open_database(database) as connection:
+                cursor = connection.cursor()
+                utils.apply_index_profile(cursor, profile.value)
+                utils.execute_sql_script(cursor, "VACUUM;")
+
+            print("Indexing [bold green]completed[/bold green].")
+
+        if layout:
+            with utils.open_database(database) as connection:
+                cursor = connection.cursor()
+                utils.apply_items_layout(cursor, layout.value)
+                utils.execute_sql_script(cursor, "VACUUM;")
+
+            print("Layout [bold green]completed[/bold green].")
+
+    except Exception as error:
+        print(f"[bold red]Error[/bold red]: {error}")
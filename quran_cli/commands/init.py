@@ -1,12 +1,11 @@
 """Init command"""
 
 from pathlib import Path
-import sqlite3
-from typing import Annotated
+from typing import Annotated, Optional
 import typer
 from rich import print
 
-from quran_cli import utils
+from quran_cli import memory, utils
 
 
 def init(
@@ -19,6 +18,38 @@ def init(
             help="Weather to generate SQL statements for this command",
         ),
     ] = False,
+    consolidate: Annotated[
+        bool,
+        typer.Option(
+            "-c",
+            "--consolidate",
+            help="Weather to also write the generated SQL as one script",
+        ),
+    ] = False,
+    in_memory: Annotated[
+        bool,
+        typer.Option(
+            "-m",
+            "--in-memory",
+            help="Weather to build the database in memory and publish it atomically",
+        ),
+    ] = False,
+    max_memory: Annotated[
+        Optional[str],
+        typer.Option(
+            "-M",
+            "--max-memory",
+            help="Memory budget to size the chunks of work for, e.g. 256M or 1G",
+        ),
+    ] = None,
+    memory_report: Annotated[
+        bool,
+        typer.Option(
+            "-r",
+            "--memory-report",
+            help="Weather to report the peak memory of each step",
+        ),
+    ] = False,
 ) -> None:
     """
     Initialize Quran database.
@@ -28,24 +59,28 @@ def init(
     ```bash
     # Create initial database
     quran-cli init db.sqlite3
+
+    # Build in memory and publish atomically
+    quran-cli init -m db.sqlite3
     ```
     """
 
     name = utils.get_database_name(database)
 
     try:
-        connection = sqlite3.connect(name)
-        cursor = connection.cursor()
+        with memory.monitor(max_memory, memory_report):
+            with utils.open_database(name, in_memory) as connection:
+                cursor = connection.cursor()
 
-        print(f"Initializing [bold]{name}[/bold]...")
+                print(f"Initializing [bold]{name}[/bold]...")
 
-        utils.apply_initial_schema(cursor, generate_sql)
-        utils.insert_initial_data(cursor, generate_sql)
+                utils.apply_initial_schema(cursor, generate_sql)
+                utils.insert_initial_data(cursor, generate_sql)
 
-        connection.commit()
-        connection.close()
+            if generate_sql and consolidate:
+                utils.consolidate_workflow()
 
-        print("Initialization [bold green]completed[/bold green].")
+            print("Initialization [bold green]completed[/bold green].")
 
     except Exception as error:
         print(f"[bold red]Error[/bold red]: {error}")
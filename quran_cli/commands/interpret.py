@@ -1,12 +1,12 @@
 """Interpret command"""
 
+import os
 from pathlib import Path
-import sqlite3
-from typing import Annotated
+from typing import Annotated, Optional
 import typer
 from rich import print
 
-from quran_cli import utils
+from quran_cli import memory, similarity, utils
 
 
 def interpret(
@@ -22,6 +22,73 @@ def interpret(
             help="Weather to generate SQL statements for this command",
         ),
     ] = False,
+    consolidate: Annotated[
+        bool,
+        typer.Option(
+            "-c",
+            "--consolidate",
+            help="Weather to also write the generated SQL as one script",
+        ),
+    ] = False,
+    in_memory: Annotated[
+        bool,
+        typer.Option(
+            "-m",
+            "--in-memory",
+            help="Weather to build the database in memory and publish it atomically",
+        ),
+    ] = False,
+    page_texts: Annotated[
+        bool,
+        typer.Option(
+            "-t",
+            "--with-page-texts",
+            help="Weather to build the page_texts table with the collections",
+        ),
+    ] = False,
+    similar: Annotated[
+        bool,
+        typer.Option(
+            "-s",
+            "--with-similarity",
+            help="Weather to compute the similar verses, requires numpy",
+        ),
+    ] = False,
+    top_k: Annotated[
+        int,
+        typer.Option(
+            "-k",
+            "--top-k",
+            min=1,
+            help="Number of similar verses to keep for each verse",
+        ),
+    ] = 10,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "-j",
+            "--jobs",
+            min=1,
+            help="Number of processes to load the collections and compute the "
+            "similar verses with [default: CPU count]",
+        ),
+    ] = os.cpu_count() or 1,
+    max_memory: Annotated[
+        Optional[str],
+        typer.Option(
+            "-M",
+            "--max-memory",
+            help="Memory budget to size the chunks of work for, e.g. 256M or 1G",
+        ),
+    ] = None,
+    memory_report: Annotated[
+        bool,
+        typer.Option(
+            "-r",
+            "--memory-report",
+            help="Weather to report the peak memory of each step",
+        ),
+    ] = False,
 ) -> None:
     """
     Add Quran interpretations (Al Muyassar) to the database.
@@ -32,22 +99,35 @@ def interpret(
     quran-cli init db.sqlite3
     quran-cli normalize -d db.sqlite3
     quran-cli interpret db.sqlite3
+
+    # Also compute the similar verses (pip install quran-cli[similarity])
+    quran-cli interpret db.sqlite3 -s
     ```
     """
 
     try:
-        connection = sqlite3.connect(database)
-        cursor = connection.cursor()
+        # Fail before the collections are committed rather than after
+        if similar:
+            similarity.require_numpy()
+
+        with memory.monitor(max_memory, memory_report):
+            with utils.open_database(database, in_memory) as connection:
+                cursor = connection.cursor()
+
+                print(f"Adding interpretations to [bold]{database}[/bold]...")
+
+                utils.insert_collections(cursor, generate_sql, jobs)
 
-        print(f"Adding interpretations to [bold]{database}[/bold]...")
+                if page_texts:
+                    utils.insert_page_texts(cursor, generate_sql, collections=True)
 
-        utils.insert_interpretations(cursor, generate_sql)
-        utils.insert_trans(cursor, generate_sql)
+                if similar:
+                    utils.insert_similar_verses(cursor, top_k, jobs)
 
-        connection.commit()
-        connection.close()
+            if generate_sql and consolidate:
+                utils.consolidate_workflow()
 
-        print("Interpretation [bold green]completed[/bold green].")
+            print("Interpretation [bold green]completed[/bold green].")
 
     except Exception as error:
         print(f"[bold red]Error[/bold red]: {error}")
@@ -0,0 +1,270 @@
+"""Load test command"""
+
+from contextlib import redirect_stdout
+import json
+import os
+from pathlib import Path
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+import typer
+from rich import box, print
+from rich.table import Table
+
+from quran_cli import utils
+from quran_cli.commands.export import Format, export_parallel
+
+
+# Constants
+DEFAULT_STEPS = (3, 30, 300)
+
+# Read queries, with a function returning random parameters for a number of
+# collections and the ids of the synthetic languages
+QUERIES = {
+    "items of a verse in a collection": (
+        'SELECT * FROM "items" WHERE "verse_id" = ? AND "collection_id" = ?',
+        lambda n, languages: (random.randint(1, 6236), random.randint(1, n)),
+    ),
+    "items of a verse": (
+        'SELECT * FROM "items" WHERE "verse_id" = ?',
+        lambda n, languages: (random.randint(1, 6236),),
+    ),
+    "page with a collection": (
+        'SELECT "verses"."number", "verses"."content", "items"."content" '
+        'FROM "verses" INNER JOIN "items" ON ("items"."verse_id" = "verses"."id") '
+        'WHERE "verses"."page_id" = ? AND "items"."collection_id" = ?',
+        lambda n, languages: (random.randint(1, 604), random.randint(1, n)),
+    ),
+    "collection in verse order": (
+        'SELECT "content" FROM "items" WHERE "collection_id" = ? ORDER BY "verse_id"',
+        lambda n, languages: (random.randint(1, n),),
+    ),
+    "collections of a language": (
+        'SELECT * FROM "collections" WHERE "language_id" = ?',
+        lambda n, languages: (random.choice(languages),),
+    ),
+}
+
+
+def get_counts(path: Path) -> Tuple[int, int]:
+    """
+    Counts the items and the collections of a database.
+
+    Args:
+        path (Path): Database file
+
+    Returns:
+        Tuple[int, int]: Number of items and last collection id, zeros without
+        an items table
+    """
+
+    connection = sqlite3.connect(path)
+    counts = (0, 0)
+
+    if connection.execute(
+        "SELECT 1 FROM \"sqlite_master\" WHERE \"type\" = 'table' AND \"name\" = 'items'"
+    ).fetchone():
+        counts = connection.execute(
+            'SELECT (SELECT COUNT(*) FROM "items"), '
+            '(SELECT COALESCE(MAX("id"), 0) FROM "collections")'
+        ).fetchone()
+
+    connection.close()
+
+    return counts
+
+
+def run_step(
+    database: Path,
+    directory: str,
+    languages: int,
+    collections: int,
+    iterations: int,
+) -> Dict[str, Any]:
+    """
+    Adds synthetic collections to a copy of a database and measures the build
+    time, file size, parallel text export throughput and query latency.
+
+    Args:
+        database (Path): Database file
+        directory (str): Working directory
+        languages (int): Number of synthetic languages
+        collections (int): Number of synthetic collections
+        iterations (int): Number of runs of each query
+
+    Returns:
+        Dict[str, Any]: Measurements
+    """
+
+    path = Path(directory) / f"{collections}.sqlite3"
+    shutil.copyfile(database, path)
+    base, last = get_counts(path)
+
+    start = time.perf_counter()
+    with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+        with utils.open_database(path) as connection:
+            utils.insert_synthetic_collections(
+                connection.cursor(), min(languages, collections), collections
+            )
+    build = time.perf_counter() - start
+
+    connection = sqlite3.connect(path)
+    items, total = connection.execute(
+        'SELECT (SELECT COUNT(*) FROM "items"), (SELECT MAX("id") FROM "collections")'
+    ).fetchone()
+    language_ids = [
+        row[0]
+        for row in connection.execute(
+            'SELECT DISTINCT "language_id" FROM "collections" WHERE "id" > ? '
+            'ORDER BY "language_id"',
+            (last,),
+        )
+    ]
+    results: Dict[str, Any] = {
+        "collections": total,
+        "items": items,
+        "build (s)": build,
+        "items/s": (items - base) / build,
+        "file size (MiB)": os.path.getsize(path) / 2**20,
+    }
+
+    start = time.perf_counter()
+    export_parallel(connection, Path(directory), Format.NDJSON, False)
+    export = time.perf_counter() - start
+    size = os.path.getsize(os.path.join(directory, "parallel.ndjson"))
+    results.update(
+        {
+            "export (s)": export,
+            "export (MiB/s)": size / 2**20 / export,
+        }
+    )
+
+    random.seed(0)
+    for name, (query, params) in QUERIES.items():
+        timings = []
+        for _ in range(iterations):
+            args = params(total, language_ids)
+            begin = time.perf_counter()
+            connection.execute(query, args).fetchall()
+            timings.append(time.perf_counter() - begin)
+
+        results[f"{name} (µs)"] = statistics.median(timings) * 1e6
+
+    connection.close()
+    os.remove(path)
+    os.remove(os.path.join(directory, "parallel.ndjson"))
+
+    return results
+
+
+def loadtest(
+    database: Annotated[
+        Path,
+        typer.Argument(exists=True, dir_okay=False, help="Normalized database file"),
+    ],
+    steps: Annotated[
+        Optional[List[int]],
+        typer.Option(
+            "-c",
+            "--collections",
+            min=1,
+            help="Number of synthetic collections of a step, 3, 30 and 300 "
+            "by default. Can be repeated",
+        ),
+    ] = None,
+    languages: Annotated[
+        int,
+        typer.Option(
+            "-l",
+            "--languages",
+            min=1,
+            help="Number of synthetic languages",
+        ),
+    ] = 20,
+    iterations: Annotated[
+        int,
+        typer.Option(
+            "-n",
+            "--iterations",
+            min=1,
+            help="Number of runs of each query",
+        ),
+    ] = 200,
+    output: Annotated[
+        Optional[Path],
+        typer.Option(
+            "-o",
+            "--output",
+            dir_okay=False,
+            help="Write the measurements to this JSON file",
+        ),
+    ] = None,
+) -> None:
+    """
+    Load test a database as the number of collections grows.
+
+    Each step adds synthetic collections to a copy of the database, then
+    measures the build time, file size, parallel text export throughput and the
+    median latency of representative queries.
+
+    Examples:
+
+    ```bash
+    quran-cli init db.sqlite3
+    quran-cli normalize db.sqlite3
+
+    quran-cli loadtest db.sqlite3
+    quran-cli loadtest db.sqlite3 -c 10 -c 100 -c 1000 -o results.json
+    ```
+    """
+
+    try:
+        steps = list(steps or DEFAULT_STEPS)
+        results: List[Dict[str, Any]] = []
+
+        with tempfile.TemporaryDirectory() as directory:
+            for collections in sorted(steps):
+                print(
+                    f"Load testing [bold]{collections}[/bold] collections...", end=" "
+                )
+                results.append(
+                    run_step(database, directory, languages, collections, iterations)
+                )
+                print("[bold green]Done[/bold green]")
+
+        table = Table(
+            title=f"Load test of {database}",
+            title_justify="left",
+            title_style="bold",
+            box=box.ROUNDED,
+            highlight=True,
+        )
+        table.add_column("Measure")
+        for collections in sorted(steps):
+            table.add_column(f"+{collections}", justify="right")
+
+        for measure in results[0]:
+            table.add_row(
+                measure,
+                *[
+                    (
+                        f"{result[measure]:,.2f}"
+                        if isinstance(result[measure], float)
+                        else f"{result[measure]:,}"
+                    )
+                    for result in results
+                ],
+            )
+
+        print(table)
+
+        if output:
+            with open(output, "w", encoding="utf-8") as file:
+                json.dump(results, file, indent=2, ensure_ascii=False)
+
+    except Exception as error:
+        print(f"[bold red]Error[/bold red]: {error}")
@@ -1,12 +1,11 @@
 """Normalize command"""
 
 from pathlib import Path
-import sqlite3
-from typing import Annotated
+from typing import Annotated, Optional
 import typer
 from rich import print
 
-from quran_cli import utils
+from quran_cli import memory, utils
 
 
 def normalize(
@@ -30,6 +29,63 @@ def normalize(
             help="Weather to generate SQL statements for this command",
         ),
     ] = False,
+    consolidate: Annotated[
+        bool,
+        typer.Option(
+            "-c",
+            "--consolidate",
+            help="Weather to also write the generated SQL as one script",
+        ),
+    ] = False,
+    words: Annotated[
+        bool,
+        typer.Option(
+            "-w",
+            "--with-words",
+            help="Weather to build the words (concordance) table",
+        ),
+    ] = False,
+    page_texts: Annotated[
+        bool,
+        typer.Option(
+            "-t",
+            "--with-page-texts",
+            help="Weather to build the page_texts table",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "-j",
+            "--jobs",
+            min=1,
+            help="Number of processes to compute text statistics with",
+        ),
+    ] = 1,
+    in_memory: Annotated[
+        bool,
+        typer.Option(
+            "-m",
+            "--in-memory",
+            help="Weather to build the database in memory and publish it atomically",
+        ),
+    ] = False,
+    max_memory: Annotated[
+        Optional[str],
+        typer.Option(
+            "-M",
+            "--max-memory",
+            help="Memory budget to size the chunks of work for, e.g. 256M or 1G",
+        ),
+    ] = None,
+    memory_report: Annotated[
+        bool,
+        typer.Option(
+            "-r",
+            "--memory-report",
+            help="Weather to report the peak memory of each step",
+        ),
+    ] = False,
 ) -> None:
     """
     Normalize initial Quran database.
@@ -41,29 +97,36 @@ def normalize(
     quran-cli init db.sqlite3
 
     quran-cli normalize db.sqlite3
+
+    # Normalize and build the words (concordance) table
+    quran-cli normalize -w db.sqlite3
+
+    # Normalize and assemble the text of every page
+    quran-cli normalize -t db.sqlite3
+
+    # Normalize in memory and publish atomically
+    quran-cli normalize -m db.sqlite3
+
+    # Size the chunks of work for 128 MiB and report the peak memory of each step
+    quran-cli normalize -M 128M -r db.sqlite3
     ```
     """
 
     try:
-        connection = sqlite3.connect(database)
-        cursor = connection.cursor()
+        with memory.monitor(max_memory, memory_report):
+            with utils.open_database(database, in_memory) as connection:
+                cursor = connection.cursor()
 
-        print(f"Normalizing [bold]{database}[/bold]...")
+                print(f"Normalizing [bold]{database}[/bold]...")
 
-        utils.apply_normalized_schema(cursor, generate_sql)
-        utils.insert_chapters(cursor, diacritics, generate_sql)
-        utils.insert_verses(cursor, generate_sql)
-        utils.insert_table_data(cursor, generate_sql)
-        utils.set_verse_fks(cursor, generate_sql)
-        utils.set_verse_count(cursor, generate_sql)
-        utils.set_foreign_keys(cursor, generate_sql)
-        utils.set_page_count(cursor, generate_sql)
-        utils.create_views(cursor, generate_sql)
+                utils.normalize_database(
+                    cursor, diacritics, generate_sql, words, jobs, page_texts
+                )
 
-        connection.commit()
-        connection.close()
+            if generate_sql and consolidate:
+                utils.consolidate_workflow()
 
-        print("Normalization [bold green]completed[/bold green].")
+            print("Normalization [bold green]completed[/bold green].")
 
     except Exception as error:
         print(f"[bold red]Error[/bold red]: {error}")
@@ -0,0 +1,285 @@
+"""Query command"""
+
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from enum import Enum
+import io
+import json
+import os
+from pathlib import Path
+import shutil
+import sqlite3
+import sys
+import tempfile
+from typing import Annotated, BinaryIO, List, Optional
+import typer
+from rich import print
+
+from quran_cli import columnar
+
+
+class Format(str, Enum):
+    """Query output formats"""
+
+    CSV = "csv"
+    TSV = "tsv"
+    NDJSON = "ndjson"
+    COLUMNAR = "columnar"
+
+
+def split_statements(script: str) -> List[str]:
+    """
+    Splits a SQL script into complete statements, line by line.
+
+    Args:
+        script (str): SQL script
+
+    Returns:
+        List[str]: Statements
+    """
+
+    statements, statement = [], ""
+
+    for line in script.splitlines(keepends=True):
+        statement += line
+
+        if sqlite3.complete_statement(statement):
+            statements.append(statement.strip())
+            statement = ""
+
+    if statement.strip():
+        statements.append(statement.strip())
+
+    return statements
+
+
+def write_results(
+    cursor: sqlite3.Cursor, file: BinaryIO, output_format: Format, batch_size: int
+) -> int:
+    """
+    Streams the rows of an executed query, `batch_size` rows at a time.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor of the executed query
+        file (BinaryIO): Output file
+        output_format (Format): Output format
+        batch_size (int): Number of rows per fetch
+
+    Returns:
+        int: Number of rows
+    """
+
+    columns = [column[0] for column in cursor.description or []]
+    count = 0
+
+    if output_format == Format.COLUMNAR:
+        columnar.write_schema(file, columns)
+
+        while rows := cursor.fetchmany(batch_size):
+            columnar.write_batch(file, rows)
+            count += len(rows)
+
+        columnar.write_end(file)
+
+        return count
+
+    text = io.TextIOWrapper(file, encoding="utf-8", newline="", write_through=True)
+
+    if output_format == Format.NDJSON:
+        while rows := cursor.fetchmany(batch_size):
+            text.writelines(
+                json.dumps(
+                    dict(zip(columns, row)),
+                    ensure_ascii=False,
+                    default=lambda value: value.hex(),
+                )
+                + "\n"
+                for row in rows
+            )
+            count += len(rows)
+
+    else:
+        writer = csv.writer(
+            text,
+            delimiter="\t" if output_format == Format.TSV else ",",
+            lineterminator="\n",
+        )
+        writer.writerow(columns)
+
+        while rows := cursor.fetchmany(batch_size):
+            writer.writerows(
+                [v.hex() if isinstance(v, bytes) else v for v in row] for row in rows
+            )
+            count += len(rows)
+
+    text.detach()
+
+    return count
+
+
+def run_query(
+    database: str, query: str, path: str, output_format: Format, batch_size: int
+) -> int:
+    """
+    Runs a query on a read-only connection and writes its results to a file.
+
+    Args:
+        database (str): Database file
+        query (str): SQL query
+        path (str): Output file
+        output_format (Format): Output format
+        batch_size (int): Number of rows per fetch
+
+    Returns:
+        int: Number of rows
+    """
+
+    connection = sqlite3.connect(
+        f"{Path(database).resolve().as_uri()}?mode=ro", uri=True
+    )
+
+    try:
+        with open(path, "wb") as file:
+            return write_results(
+                connection.execute(query), file, output_format, batch_size
+            )
+
+    finally:
+        connection.close()
+
+
+def query(
+    database: Annotated[
+        Path,
+        typer.Argument(exists=True, dir_okay=False, help="Database file"),
+    ],
+    statements: Annotated[
+        Optional[List[str]],
+        typer.Argument(help="SQL queries", show_default=False),
+    ] = None,
+    scripts: Annotated[
+        Optional[List[Path]],
+        typer.Option(
+            "-s",
+            "--script",
+            exists=True,
+            dir_okay=False,
+            help="File of independent SQL queries. Can be repeated",
+        ),
+    ] = None,
+    output_format: Annotated[
+        Format,
+        typer.Option(
+            "-f",
+            "--format",
+            help="Output format",
+        ),
+    ] = Format.CSV,
+    output: Annotated[
+        Optional[Path],
+        typer.Option(
+            "-o",
+            "--output",
+            help="Output file, or folder of numbered files for several queries "
+            "[default: stdout]",
+        ),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "-j",
+            "--jobs",
+            min=1,
+            help="Number of queries to run concurrently [default: CPU count]",
+        ),
+    ] = os.cpu_count() or 1,
+    batch_size: Annotated[
+        int,
+        typer.Option(
+            "-b",
+            "--batch-size",
+            min=1,
+            help="Number of rows fetched at a time",
+        ),
+    ] = 1024,
+) -> None:
+    """
+    Run SQL queries on a read-only connection and stream the results.
+
+    The results are written as CSV, TSV, NDJSON or columnar binary (see
+    `quran_cli.columnar`). Several queries run concurrently, each in its own
+    process and connection, their results are written in order.
+
+    Examples:
+
+    ```bash
+    quran-cli query db.sqlite3 "SELECT * FROM chapters" > chapters.csv
+    quran-cli query db.sqlite3 "SELECT * FROM verses WHERE page_id = 1" -f ndjson
+
+    # Run the queries of a report concurrently, one file per query
+    quran-cli query db.sqlite3 -s report.sql -o report -f tsv
+    ```
+    """
+
+    try:
+        queries = list(statements or [])
+        for script in scripts or []:
+            with open(script, "r", encoding="utf-8") as file:
+                queries.extend(split_statements(file.read()))
+
+        if not queries:
+            raise ValueError("No query to run, pass SQL or a --script")
+
+        extension = "bin" if output_format == Format.COLUMNAR else output_format.value
+
+        if len(queries) == 1:
+            if output:
+                run_query(str(database), queries[0], output, output_format, batch_size)
+
+            else:
+                connection = sqlite3.connect(
+                    f"{database.resolve().as_uri()}?mode=ro", uri=True
+                )
+                write_results(
+                    connection.execute(queries[0]),
+                    sys.stdout.buffer,
+                    output_format,
+                    batch_size,
+                )
+                connection.close()
+
+            return
+
+        with tempfile.TemporaryDirectory() as directory:
+            folder = output or Path(directory)
+            os.makedirs(folder, exist_ok=True)
+            paths = [
+                os.path.join(folder, f"{i:03}.{extension}")
+                for i in range(1, len(queries) + 1)
+            ]
+
+            with ProcessPoolExecutor(min(jobs, len(queries))) as executor:
+                futures = [
+                    executor.submit(
+                        run_query,
+                        str(database),
+                        sql,
+                        path,
+                        output_format,
+                        batch_size,
+                    )
+                    for sql, path in zip(queries, paths)
+                ]
+
+                for future, path in zip(futures, paths):
+                    future.result()
+
+                    if not output:
+                        with open(path, "rb") as file:
+                            shutil.copyfileobj(file, sys.stdout.buffer)
+
+        sys.stdout.flush()
+
+    except Exception as error:
+        print(f"[bold red]Error[/bold red]: {error}", file=sys.stderr)
+        raise typer.Exit(1)
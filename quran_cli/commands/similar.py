@@ -0,0 +1,78 @@
+"""Similar command"""
+
+from pathlib import Path
+import sqlite3
+from typing import Annotated
+import typer
+from rich import box, print
+from rich.table import Table
+
+
+def similar(
+    database: Annotated[
+        Path,
+        typer.Argument(exists=True, dir_okay=False, help="Database file"),
+    ],
+    chapter: Annotated[int, typer.Argument(min=1, max=114, help="Chapter number")],
+    verse: Annotated[int, typer.Argument(min=1, help="Verse number")],
+    limit: Annotated[
+        int,
+        typer.Option(
+            "-k",
+            "--limit",
+            min=1,
+            help="Maximum number of similar verses to show",
+        ),
+    ] = 10,
+) -> None:
+    """
+    List the verses most similar to a verse.
+
+    Notes:
+        Requires the similar_verses table, see `quran-cli interpret --with-similarity`.
+
+    Examples:
+
+    ```bash
+    quran-cli interpret db.sqlite3 -s
+
+    quran-cli similar db.sqlite3 2 255
+    quran-cli similar db.sqlite3 2 255 -k 5
+    ```
+    """
+
+    try:
+        connection = sqlite3.connect(f"{database.resolve().as_uri()}?mode=ro", uri=True)
+        cursor = connection.cursor()
+
+        results = cursor.execute(
+            'SELECT "similar_verses"."rank", "verses"."chapter_id", "verses"."number", '
+            'printf(\'%.3f\', "similar_verses"."score"), "verses"."content" '
+            'FROM "similar_verses" '
+            'INNER JOIN "verses" ON ("similar_verses"."similar_id" = "verses"."id") '
+            'WHERE "similar_verses"."verse_id" = (SELECT "id" FROM "verses" '
+            'WHERE "chapter_id" = ? AND "number" = ?) AND "similar_verses"."rank" <= ? '
+            'ORDER BY "similar_verses"."rank"',
+            (chapter, verse, limit),
+        ).fetchall()
+
+        connection.close()
+
+        table = Table(
+            title=f"Verses similar to {chapter}:{verse}",
+            title_justify="left",
+            title_style="bold",
+            box=box.ROUNDED,
+            highlight=True,
+        )
+
+        for column in ["Rank", "Chapter", "Verse", "Score", "Content"]:
+            table.add_column(column)
+
+        for row in results:
+            table.add_row(*[str(item) for item in row])
+
+        print(table)
+
+    except Exception as error:
+        print(f"[bold red]Error[/bold red]: {error}")
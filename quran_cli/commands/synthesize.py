@@ -0,0 +1,79 @@
+"""Synthesize command"""
+
+from pathlib import Path
+from typing import Annotated
+import typer
+from rich import print
+
+from quran_cli import utils
+
+
+def synthesize(
+    database: Annotated[
+        Path,
+        typer.Argument(exists=True, dir_okay=False, help="Database file"),
+    ],
+    languages: Annotated[
+        int,
+        typer.Option(
+            "-l",
+            "--languages",
+            min=1,
+            help="Number of synthetic languages to add",
+        ),
+    ] = 10,
+    collections: Annotated[
+        int,
+        typer.Option(
+            "-c",
+            "--collections",
+            min=1,
+            help="Number of synthetic collections to add",
+        ),
+    ] = 30,
+    seed: Annotated[
+        int,
+        typer.Option(
+            "-s",
+            "--seed",
+            help="Random seed, the same seed generates the same data",
+        ),
+    ] = 0,
+    in_memory: Annotated[
+        bool,
+        typer.Option(
+            "-m",
+            "--in-memory",
+            help="Weather to build the database in memory and publish it atomically",
+        ),
+    ] = False,
+) -> None:
+    """
+    Add synthetic collections to a normalized database.
+
+    New languages, collections and items are added, one item per verse and
+    collection, to test the database at production scale.
+
+    Examples:
+
+    ```bash
+    quran-cli init db.sqlite3
+    quran-cli normalize db.sqlite3
+
+    # 300 collections in 20 languages, about 1.9 million items
+    quran-cli synthesize db.sqlite3 -l 20 -c 300
+    ```
+    """
+
+    try:
+        with utils.open_database(database, in_memory) as connection:
+            cursor = connection.cursor()
+
+            print(f"Synthesizing data in [bold]{database}[/bold]...")
+
+            utils.insert_synthetic_collections(cursor, languages, collections, seed)
+
+        print("Synthesis [bold green]completed[/bold green].")
+
+    except Exception as error:
+        print(f"[bold red]Error[/bold red]: {error}")
@@ -0,0 +1,320 @@
+"""Verify command"""
+
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+from typing import Annotated, Any, Dict, List, Optional
+import typer
+from rich import box, print
+from rich.table import Table
+
+from quran_cli import TABLE_FIELDS
+
+
+# Constants
+VERSE_COUNT = 6236
+UNITS = ["chapters", "parts", "groups", "quarters", "pages"]
+
+# Each query returns the number of rows violating the invariant
+INVARIANTS = {
+    "verses": {
+        "6236 verses": f'SELECT COUNT(*) != {VERSE_COUNT} FROM "verses"',
+        "verses have all foreign keys": 'SELECT COUNT(*) FROM "verses" WHERE '
+        '"chapter_id" IS NULL OR "part_id" IS NULL OR "group_id" IS NULL '
+        'OR "quarter_id" IS NULL OR "page_id" IS NULL',
+        **{
+            f"{t} verse_count sums to 6236": f'SELECT SUM("verse_count") '
+            f'IS NOT {VERSE_COUNT} FROM "{t}"'
+            for t in UNITS
+        },
+        **{
+            f"{t} verse_count matches verses": f'SELECT COUNT(*) FROM "{t}" '
+            f'WHERE "verse_count" != (SELECT COUNT(*) FROM "verses" '
+            f'WHERE "verses"."{t[:-1]}_id" = "{t}"."id")'
+            for t in UNITS
+        },
+        **{
+            f"{t} word_count sums match chapters": "SELECT (SELECT "
+            f'SUM("{t}"."word_count") FROM "{t}") IS NOT '
+            '(SELECT SUM("chapters"."word_count") FROM "chapters")'
+            for t in UNITS[1:]
+        },
+    },
+    "groups": {
+        "groups have part_id": 'SELECT COUNT(*) FROM "groups" WHERE "part_id" IS NULL',
+    },
+    "quarters": {
+        "quarters have all foreign keys": 'SELECT COUNT(*) FROM "quarters" '
+        'WHERE "part_id" IS NULL OR "group_id" IS NULL',
+    },
+    "pages": {
+        "pages have all foreign keys": 'SELECT COUNT(*) FROM "pages" WHERE '
+        '"chapter_id" IS NULL OR "part_id" IS NULL OR "group_id" IS NULL '
+        'OR "quarter_id" IS NULL',
+    },
+    "items": {
+        "items reference verses": 'SELECT COUNT(*) FROM "items" WHERE "verse_id" '
+        'NOT IN (SELECT "id" FROM "verses")',
+    },
+}
+
+
+def encode_row(row: Any) -> bytes:
+    """
+    Serializes a row for hashing, independent of the SQLite version and platform.
+
+    Args:
+        row (Any): Row values
+
+    Returns:
+        bytes: Row representation
+    """
+
+    return (
+        json.dumps(list(row), ensure_ascii=False, separators=(",", ":")) + "\n"
+    ).encode("utf-8")
+
+
+def get_manifest(connection: sqlite3.Connection) -> Dict[str, Any]:
+    """
+    Computes an order-stable SHA-256 digest of each table and each chapter
+    (its verses and items) in one pass per table.
+
+    Only the columns present in the database are digested, the others are
+    listed as missing (e.g. the statistics columns of an older build).
+
+    Args:
+        connection (sqlite3.Connection): Database connection
+
+    Returns:
+        Dict[str, Any]: Manifest with row counts and digests
+    """
+
+    tables = {
+        row[0]
+        for row in connection.execute(
+            'SELECT "name" FROM "sqlite_master" WHERE "type" = \'table\''
+        )
+    }
+
+    manifest: Dict[str, Any] = {"tables": {}, "chapters": {}}
+    chapters: Dict[int, Any] = {}
+
+    for name, fields in TABLE_FIELDS.items():
+        if name not in tables:
+            continue
+
+        present = {row[1] for row in connection.execute(f'PRAGMA table_info("{name}")')}
+        missing = [field for field in fields.values() if field not in present]
+        columns = ", ".join(
+            f'"{name}"."{field}"' for field in fields.values() if field in present
+        )
+        query = f'SELECT {columns}, NULL FROM "{name}" ORDER BY "{name}"."id"'
+
+        if name == "verses":
+            query = f'SELECT {columns}, "chapter_id" FROM "verses" ORDER BY "id"'
+
+        elif name == "items":
+            query = (
+                f'SELECT {columns}, "verses"."chapter_id" FROM "items" '
+                'LEFT JOIN "verses" ON ("items"."verse_id" = "verses"."id") '
+                'ORDER BY "items"."id"'
+            )
+
+        digest, count = hashlib.sha256(), 0
+        for *row, chapter_id in connection.execute(query):
+            data = encode_row(row)
+            digest.update(data)
+            count += 1
+
+            if chapter_id is not None:
+                chapters.setdefault(chapter_id, hashlib.sha256()).update(
+                    name.encode() + b":" + data
+                )
+
+        manifest["tables"][name] = {"rows": count, "sha256": digest.hexdigest()}
+        if missing:
+            manifest["tables"][name]["missing"] = missing
+
+    manifest["chapters"] = {
+        str(chapter_id): digest.hexdigest()
+        for chapter_id, digest in sorted(chapters.items())
+    }
+
+    return manifest
+
+
+def check_invariants(connection: sqlite3.Connection) -> Dict[str, int]:
+    """
+    Runs the structural invariants of the tables present in the database,
+    those using a missing column are skipped.
+
+    Args:
+        connection (sqlite3.Connection): Database connection
+
+    Returns:
+        Dict[str, int]: Number of violations by invariant
+    """
+
+    tables = {
+        row[0]
+        for row in connection.execute(
+            'SELECT "name" FROM "sqlite_master" WHERE "type" = \'table\''
+        )
+    }
+
+    results = {}
+    for table, queries in INVARIANTS.items():
+        if table not in tables or not set(UNITS) <= tables:
+            continue
+
+        for name, query in queries.items():
+            try:
+                results[name] = connection.execute(query).fetchone()[0] or 0
+
+            except sqlite3.OperationalError as error:
+                if "no such column" not in str(error):
+                    raise
+
+    results["foreign keys"] = len(
+        connection.execute("PRAGMA foreign_key_check").fetchall()
+    )
+
+    return results
+
+
+def compare_manifests(manifest: Dict[str, Any], reference: Dict[str, Any]) -> List[str]:
+    """
+    Lists the differences between a manifest and a reference manifest.
+
+    Args:
+        manifest (Dict[str, Any]): Computed manifest
+        reference (Dict[str, Any]): Reference manifest
+
+    Returns:
+        List[str]: Differences, empty when they match
+    """
+
+    errors = []
+
+    for section in ["tables", "chapters"]:
+        expected, actual = reference.get(section, {}), manifest[section]
+
+        for key in sorted(set(expected) | set(actual)):
+            if key not in actual:
+                errors.append(f"{section[:-1]} {key} is missing")
+
+            elif key not in expected:
+                errors.append(f"{section[:-1]} {key} is not in the reference")
+
+            elif section == "tables" and actual[key].get("missing"):
+                errors.append(
+                    f"table {key} is missing columns "
+                    + ", ".join(actual[key]["missing"])
+                )
+
+            elif expected[key] != actual[key]:
+                errors.append(f"{section[:-1]} {key} differs")
+
+    return errors
+
+
+def verify(
+    database: Annotated[
+        Path,
+        typer.Argument(exists=True, dir_okay=False, help="Database file"),
+    ],
+    reference: Annotated[
+        Optional[Path],
+        typer.Option(
+            "-r",
+            "--reference",
+            exists=True,
+            dir_okay=False,
+            help="Reference manifest to compare against",
+        ),
+    ] = None,
+    output: Annotated[
+        Optional[Path],
+        typer.Option(
+            "-o",
+            "--output",
+            dir_okay=False,
+            help="Write the manifest of the database to this file",
+        ),
+    ] = None,
+) -> None:
+    """
+    Verify a Quran database with digests and structural invariants.
+
+    Each table and each chapter has a SHA-256 digest, which can be compared with
+    a reference manifest. Exits with code 1 when a check fails.
+
+    Examples:
+
+    ```bash
+    # Record the manifest of a known-good database
+    quran-cli verify good.sqlite3 -o manifest.json
+
+    # Check a new build against it
+    quran-cli verify db.sqlite3 -r manifest.json
+    ```
+    """
+
+    errors: List[str] = []
+
+    try:
+        connection = sqlite3.connect(f"{database.resolve().as_uri()}?mode=ro", uri=True)
+
+        print(f"Verifying [bold]{database}[/bold]...")
+
+        manifest = get_manifest(connection)
+        invariants = check_invariants(connection)
+        connection.close()
+
+        table = Table(
+            title="Tables",
+            title_justify="left",
+            title_style="bold",
+            box=box.ROUNDED,
+        )
+        for column in ["Table", "Rows", "SHA-256"]:
+            table.add_column(column)
+        for name, item in manifest["tables"].items():
+            table.add_row(name, str(item["rows"]), item["sha256"])
+        print(table)
+
+        table = Table(
+            title="Invariants",
+            title_justify="left",
+            title_style="bold",
+            box=box.ROUNDED,
+        )
+        for column in ["Invariant", "Violations"]:
+            table.add_column(column)
+        for name, count in invariants.items():
+            table.add_row(name, f"[bold {'red' if count else 'green'}]{count}[/]")
+            if count:
+                errors.append(f"invariant {name!r} has {count} violation(s)")
+        print(table)
+
+        if reference:
+            with open(reference, "r", encoding="utf-8") as file:
+                errors.extend(compare_manifests(manifest, json.load(file)))
+
+        if output:
+            with open(output, "w", encoding="utf-8") as file:
+                json.dump(manifest, file, indent=2)
+
+    except Exception as error:
+        print(f"[bold red]Error[/bold red]: {error}")
+        raise typer.Exit(1)
+
+    for error in errors:
+        print(f"[bold red]Error[/bold red]: {error}")
+
+    if errors:
+        raise typer.Exit(1)
+
+    print("Verification [bold green]completed[/bold green].")
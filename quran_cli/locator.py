@@ -0,0 +1,206 @@
+"""Hierarchy locator, maps verses to parts, groups, quarters and pages"""
+
+from array import array
+from bisect import bisect_right
+from functools import cache
+import json
+from pathlib import Path
+import re
+from typing import Dict, List, Literal, Tuple
+
+
+# Constants
+PARENT = Path(__file__).parent
+METADATA = PARENT / "assets/data/metadata.json"
+VERSE_COUNT = 6236
+CHAPTERS = PARENT / "assets/data/chapters.sql"
+# A row of chapters.sql, ("name", type, order, verse_count)
+CHAPTER_ROW = re.compile(r"^\s*\(.*,\s*(\d+)\)[,;]\s*$")
+
+
+def get_chapter_verse_counts() -> Tuple[int, ...]:
+    """
+    Reads the verse count of each chapter, the last column of `chapters.sql`.
+
+    Returns:
+        Tuple[int, ...]: Verse count of each chapter, in chapter order
+    """
+
+    with open(CHAPTERS, "r", encoding="utf-8") as file:
+        counts = tuple(
+            int(match[1]) for line in file if (match := CHAPTER_ROW.match(line))
+        )
+
+    if sum(counts) != VERSE_COUNT:
+        raise ValueError(f"{CHAPTERS.name} has {sum(counts)} verses, not {VERSE_COUNT}")
+
+    return counts
+
+
+CHAPTER_VERSE_COUNTS = get_chapter_verse_counts()
+
+Table = Literal["parts", "groups", "quarters", "pages"]
+
+
+class Locator:
+    """
+    Array backed boundary index of the Quran hierarchy.
+
+    Each table is stored as the sorted first verse ids of its items, a verse
+    belongs to the last item starting at or before it, found with `bisect`.
+    Verse ids are the position of the verse in the Quran, starting at 1.
+
+    Examples:
+
+    ```python
+    locator = get_locator()
+    locator.locate(locator.verse_id(2, 255))
+    # {'part': 3, 'group': 5, 'quarter': 17, 'page': 42}
+    ```
+    """
+
+    def __init__(self, boundaries: Dict[str, List[Tuple[int, int]]]) -> None:
+        """
+        Args:
+            boundaries (Dict[str, List[Tuple[int, int]]]): First (chapter, verse)
+            of each part, quarter and page, as in `metadata.json`
+        """
+
+        # chapters[c - 1] is the id of the verse before chapter c, plus a sentinel
+        self.chapters = array("H", [0])
+        for count in CHAPTER_VERSE_COUNTS:
+            self.chapters.append(self.chapters[-1] + count)
+
+        self.starts: Dict[str, array] = {
+            table: array("H", [self.verse_id(*item[:2]) for item in boundaries[table]])
+            for table in ["parts", "quarters", "pages"]
+        }
+
+        # Group = 4 Quarters
+        self.starts["groups"] = self.starts["quarters"][::4]
+
+    def verse_id(self, chapter_id: int, verse_number: int) -> int:
+        """
+        Returns the id of a verse.
+
+        Args:
+            chapter_id (int): Chapter ID
+            verse_number (int): Verse number
+
+        Returns:
+            int: Verse ID
+        """
+
+        if not 1 <= chapter_id <= len(CHAPTER_VERSE_COUNTS) or not (
+            1 <= verse_number <= CHAPTER_VERSE_COUNTS[chapter_id - 1]
+        ):
+            raise ValueError(f"Invalid verse {chapter_id}:{verse_number}")
+
+        return self.chapters[chapter_id - 1] + verse_number
+
+    def chapter_verse(self, verse_id: int) -> Tuple[int, int]:
+        """
+        Returns the chapter id and verse number of a verse.
+
+        Args:
+            verse_id (int): Verse ID
+
+        Returns:
+            Tuple[int, int]: Chapter ID and verse number
+        """
+
+        self.check(verse_id)
+        chapter_id = bisect_right(self.chapters, verse_id - 1)
+
+        return chapter_id, verse_id - self.chapters[chapter_id - 1]
+
+    def find(self, table: Table, verse_id: int) -> int:
+        """
+        Returns the id of the part, group, quarter or page containing a verse.
+
+        Args:
+            table (str): Table name
+            verse_id (int): Verse ID
+
+        Returns:
+            int: Item ID
+        """
+
+        self.check(verse_id)
+
+        return bisect_right(self.starts[table], verse_id)
+
+    def locate(self, verse_id: int) -> Dict[str, int]:
+        """
+        Returns the part, group, quarter and page of a verse.
+
+        Args:
+            verse_id (int): Verse ID
+
+        Returns:
+            Dict[str, int]: Item ID by singular table name
+        """
+
+        return {
+            table[:-1]: self.find(table, verse_id)
+            for table in ["parts", "groups", "quarters", "pages"]
+        }
+
+    def verse_range(self, table: Table, id: int) -> Tuple[int, int]:
+        """
+        Returns the verse range of a part, group, quarter or page.
+
+        Args:
+            table (str): Table name
+            id (int): Item ID
+
+        Returns:
+            Tuple[int, int]: Start and end verse ids
+        """
+
+        starts = self.starts[table]
+
+        if not 1 <= id <= len(starts):
+            raise ValueError(f"Invalid {table[:-1]} {id}")
+
+        return starts[id - 1], starts[id] - 1 if id < len(starts) else VERSE_COUNT
+
+    def ranges(self, table: Table) -> List[Tuple[int, int]]:
+        """
+        Returns the verse ranges of all parts, groups, quarters or pages.
+        The index of the range in the list is the item id - 1.
+
+        Args:
+            table (str): Table name
+
+        Returns:
+            List[Tuple[int, int]]: Start and end verse ids of each item
+        """
+
+        return [
+            self.verse_range(table, id) for id in range(1, len(self.starts[table]) + 1)
+        ]
+
+    def check(self, verse_id: int) -> None:
+        """
+        Raises ValueError if a verse id is out of range.
+
+        Args:
+            verse_id (int): Verse ID
+        """
+
+        if not 1 <= verse_id <= VERSE_COUNT:
+            raise ValueError(f"Invalid verse id {verse_id}")
+
+
+@cache
+def get_locator() -> Locator:
+    """
+    Returns the locator compiled from `metadata.json`, built once per process.
+
+    Returns:
+        Locator: Hierarchy locator
+    """
+
+    with open(METADATA, "r", encoding="utf-8") as file:
+        return Locator(json.load(file))
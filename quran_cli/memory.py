@@ -0,0 +1,382 @@
+"""Memory budget, chunk sizes and peak memory reporting"""
+
+from contextlib import contextmanager
+import functools
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from rich import box, print
+from rich.table import Table
+
+try:
+    import resource
+
+except ImportError:
+    resource = None
+
+
+# Constants
+MIB = 2**20
+DEFAULT_CHUNK_BYTES = 4 * MIB
+MIN_CHUNK_BYTES = 64 * 2**10
+MAX_CHUNK_BYTES = 16 * MIB
+
+# A chunk may take this fraction of the budget, parsing SQL text or building
+# rows from it takes several times the size of the chunk
+CHUNK_SHARE = 16
+
+# Share of the budget given to the SQLite page cache and heap
+CACHE_SHARE = 4
+HEAP_SHARE = 2
+
+SAMPLE_INTERVAL = 0.005
+# Worker processes are found by scanning /proc, every few samples only
+WORKERS_SAMPLE_EVERY = 10
+SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]?)i?b?\s*$", re.IGNORECASE)
+UNITS = {"": MIB, "k": 2**10, "m": MIB, "g": 2**30}
+REPORT_COLUMNS = ["Step", "Time (s)", "Python (MiB)", "RSS (MiB)", "Workers (MiB)"]
+
+# Memory budget in bytes, the monitor of the running command and the soft heap
+# limit of SQLite before the budget was applied
+SETTINGS: Dict[str, Any] = {"budget": None, "monitor": None, "heap_limit": None}
+
+
+def parse_size(size: str) -> int:
+    """
+    Parses a memory size, in MiB when it has no unit: `512`, `64M`, `1.5G`...
+
+    Args:
+        size (str): Memory size
+
+    Returns:
+        int: Size in bytes
+    """
+
+    match = SIZE.match(size)
+
+    if not match or float(match[1]) <= 0:
+        raise ValueError(f"Invalid memory size {size!r}, expected e.g. 256M or 1G")
+
+    return int(float(match[1]) * UNITS[match[2].lower()])
+
+
+def set_budget(budget: Optional[int]) -> None:
+    """
+    Sets the memory budget the chunk sizes are derived from.
+
+    Args:
+        budget (Optional[int]): Budget in bytes, None for the default chunk sizes
+    """
+
+    SETTINGS["budget"] = budget
+
+
+def get_chunk_bytes() -> int:
+    """
+    Returns the size of the chunks of SQL text or rows processed at once.
+
+    Returns:
+        int: Chunk size in bytes
+    """
+
+    budget = SETTINGS["budget"]
+
+    if budget is None:
+        return DEFAULT_CHUNK_BYTES
+
+    return max(MIN_CHUNK_BYTES, min(MAX_CHUNK_BYTES, budget // CHUNK_SHARE))
+
+
+def get_batch_size(row_bytes: int, default: int = 1024) -> int:
+    """
+    Returns the number of rows fetched or written at once.
+
+    Args:
+        row_bytes (int): Estimated size of a row in bytes
+        default (int): Number of rows without a budget
+
+    Returns:
+        int: Number of rows
+    """
+
+    if SETTINGS["budget"] is None:
+        return default
+
+    return max(1, get_chunk_bytes() // row_bytes)
+
+
+def configure_connection(connection: sqlite3.Connection) -> None:
+    """
+    Bounds the SQLite page cache and heap of a connection by the memory budget.
+
+    Args:
+        connection (sqlite3.Connection): Database connection
+    """
+
+    budget = SETTINGS["budget"]
+
+    if budget is None:
+        return
+
+    connection.execute(f"PRAGMA cache_size = -{budget // CACHE_SHARE // 1024}")
+
+    # The soft heap limit is process-wide, `reset_heap_limit` restores it
+    if SETTINGS["heap_limit"] is None:
+        SETTINGS["heap_limit"] = connection.execute(
+            "PRAGMA soft_heap_limit"
+        ).fetchone()[0]
+
+    connection.execute(f"PRAGMA soft_heap_limit = {budget // HEAP_SHARE}")
+
+
+def reset_heap_limit() -> None:
+    """Restores the SQLite soft heap limit changed by `configure_connection`."""
+
+    if SETTINGS["heap_limit"] is None:
+        return
+
+    connection = sqlite3.connect(":memory:")
+    connection.execute(f"PRAGMA soft_heap_limit = {SETTINGS['heap_limit']}")
+    connection.close()
+
+    SETTINGS["heap_limit"] = None
+
+
+def get_rss() -> Optional[int]:
+    """
+    Returns the resident set size of this process, or its peak when the current
+    size is unavailable (not Linux).
+
+    Returns:
+        Optional[int]: Size in bytes, None if unavailable
+    """
+
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def get_workers_rss() -> Optional[int]:
+    """
+    Returns the total resident set size of the child processes of this process,
+    the workers of the process pools (Linux only).
+
+    Returns:
+        Optional[int]: Size in bytes, None if unavailable
+    """
+
+    try:
+        entries = os.listdir("/proc")
+
+    except OSError:
+        return None
+
+    pid, total = str(os.getpid()), 0
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+
+        try:
+            with open(f"/proc/{entry}/stat", "r", encoding="utf-8") as file:
+                stat = file.read()
+
+            # The fields after the command name are the state, then the parent id
+            if stat[stat.rindex(")") + 2 :].split()[1] != pid:
+                continue
+
+            with open(f"/proc/{entry}/statm", "r", encoding="utf-8") as file:
+                total += int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+        except (OSError, ValueError, IndexError):
+            continue
+
+    return total
+
+
+class MemoryMonitor:
+    """
+    Records the elapsed time, the Python allocation peak (tracemalloc), the
+    resident set size peak and the total resident set size peak of the worker
+    processes (both sampled by a thread) of each step of a command.
+    """
+
+    def __init__(self) -> None:
+        self.steps: List[Tuple[str, float, int, Optional[int], Optional[int]]] = []
+        self.depth = 0
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """
+        Measures a step, nested steps are part of the outermost one.
+
+        Args:
+            name (str): Step name
+        """
+
+        if self.depth:
+            self.depth += 1
+            try:
+                yield
+            finally:
+                self.depth -= 1
+            return
+
+        self.depth += 1
+        stop = threading.Event()
+        peak = [get_rss(), get_workers_rss()]
+
+        def update(index: int, rss: Optional[int]) -> None:
+            if rss is not None:
+                peak[index] = max(peak[index] or 0, rss)
+
+        def sample() -> None:
+            count = 0
+            while not stop.wait(SAMPLE_INTERVAL):
+                update(0, get_rss())
+
+                count += 1
+                if count % WORKERS_SAMPLE_EVERY == 0:
+                    update(1, get_workers_rss())
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+
+        try:
+            yield
+
+        finally:
+            elapsed = time.perf_counter() - start
+            allocated = tracemalloc.get_traced_memory()[1] - current
+
+            stop.set()
+            sampler.join()
+            update(0, get_rss())
+
+            self.steps.append((name, elapsed, allocated, *peak))
+            self.depth -= 1
+
+    def print_report(self) -> None:
+        """Prints the peak memory of each step, against the budget if any."""
+
+        budget = SETTINGS["budget"]
+        title = "Peak memory per step"
+        if budget is not None:
+            title += f", budget {budget / MIB:,.1f} MiB"
+
+        table = Table(
+            title=title,
+            title_justify="left",
+            title_style="bold",
+            box=box.ROUNDED,
+        )
+        for column in REPORT_COLUMNS:
+            table.add_column(column, justify="left" if column == "Step" else "right")
+
+        for name, elapsed, allocated, rss, workers in self.steps:
+            resident = "-" if rss is None else f"{rss / MIB:,.1f}"
+            if budget is not None and (rss or 0) + (workers or 0) > budget:
+                resident = f"[bold red]{resident}[/bold red]"
+
+            table.add_row(
+                name,
+                f"{elapsed:,.2f}",
+                f"{allocated / MIB:,.1f}",
+                resident,
+                "-" if workers is None else f"{workers / MIB:,.1f}",
+            )
+
+        print(table)
+
+
+@contextmanager
+def monitor(
+    max_memory: Optional[str] = None, report: bool = False
+) -> Iterator[Optional[MemoryMonitor]]:
+    """
+    Applies a memory budget and measures the tracked steps of a command, the
+    report is printed when the block succeeds.
+
+    Args:
+        max_memory (Optional[str]): Memory budget, see `parse_size`
+        report (bool): Weather to measure and report the peak memory of each step
+
+    Yields:
+        Optional[MemoryMonitor]: The monitor, None when not reporting
+    """
+
+    set_budget(parse_size(max_memory) if max_memory else None)
+
+    tracing = tracemalloc.is_tracing()
+    if report and not tracing:
+        tracemalloc.start()
+
+    SETTINGS["monitor"] = MemoryMonitor() if report else None
+
+    try:
+        yield SETTINGS["monitor"]
+
+        if report:
+            SETTINGS["monitor"].print_report()
+
+    finally:
+        SETTINGS["monitor"] = None
+        set_budget(None)
+        reset_heap_limit()
+
+        if report and not tracing:
+            tracemalloc.stop()
+
+
+@contextmanager
+def step(name: str) -> Iterator[None]:
+    """
+    Measures a block as a step of the running monitor, if any.
+
+    Args:
+        name (str): Step name
+    """
+
+    if SETTINGS["monitor"] is None:
+        yield
+        return
+
+    with SETTINGS["monitor"].step(name):
+        yield
+
+
+def track(function: Callable) -> Callable:
+    """
+    Decorates a pipeline step to be measured by the running monitor, if any.
+
+    Args:
+        function (Callable): Step function
+
+    Returns:
+        Callable: Decorated function
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with step(function.__name__):
+            return function(*args, **kwargs)
+
+    return wrapper
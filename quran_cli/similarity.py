@@ -0,0 +1,193 @@
+"""Verse similarity, TF-IDF vectors and top-k cosine neighbours"""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+
+# Constants
+BLOCK_SIZE = 64
+LATIN_WORD = re.compile(r"[a-z]+")
+
+# Sparse matrix shared with the worker processes
+MATRIX: Dict[str, Any] = {}
+
+
+def require_numpy() -> None:
+    """Raises a helpful error when the optional numpy dependency is missing."""
+
+    if np is None:
+        raise RuntimeError(
+            "numpy is required to compute verse similarity, "
+            "install it with: pip install quran-cli[similarity]"
+        )
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits a translation into lowercase words.
+
+    Args:
+        text (str): Translation text
+
+    Returns:
+        List[str]: Words
+    """
+
+    return LATIN_WORD.findall(text.lower())
+
+
+def get_tfidf(documents: List[Iterable[str]]) -> Tuple[Any, Any, Any]:
+    """
+    Builds L2-normalized TF-IDF vectors (sublinear tf) as a CSR matrix.
+
+    Args:
+        documents (List[Iterable[str]]): Terms of each document
+
+    Returns:
+        Tuple[Any, Any, Any]: CSR indptr, indices and data arrays
+    """
+
+    require_numpy()
+
+    vocabulary: Dict[str, int] = {}
+    indptr, indices, counts = [0], [], []
+
+    for terms in documents:
+        row: Dict[int, int] = {}
+        for term in terms:
+            column = vocabulary.setdefault(term, len(vocabulary))
+            row[column] = row.get(column, 0) + 1
+
+        indices.extend(row.keys())
+        counts.extend(row.values())
+        indptr.append(len(indices))
+
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    data = 1.0 + np.log(np.asarray(counts, dtype=np.float32))
+
+    # Smoothed inverse document frequency
+    frequency = np.bincount(indices, minlength=len(vocabulary))
+    data *= (np.log((1 + len(documents)) / (1 + frequency)) + 1)[indices]
+
+    # L2 normalization of each row
+    rows = np.repeat(np.arange(len(documents)), np.diff(indptr))
+    norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=len(documents)))
+    data /= np.where(norms > 0, norms, 1)[rows]
+
+    return indptr, indices, data.astype(np.float32)
+
+
+def set_matrix(indptr: Any, indices: Any, data: Any) -> None:
+    """
+    Sets the matrix used by `get_neighbours`, the process pool initializer.
+
+    Args:
+        indptr (Any): CSR indptr array
+        indices (Any): CSR indices array
+        data (Any): CSR data array
+    """
+
+    MATRIX.update(
+        indptr=indptr,
+        indices=indices,
+        data=data,
+        rows=np.repeat(np.arange(len(indptr) - 1), np.diff(indptr)),
+        columns=int(indices.max()) + 1 if len(indices) else 0,
+    )
+
+
+def get_neighbours(start: int, end: int, top_k: int) -> List[Tuple[int, int, float]]:
+    """
+    Finds the top-k most similar documents of the rows start to end - 1.
+
+    The cosine similarities of the block with every document are computed as
+    a sparse-dense product, X @ B.T, then reduced with `argpartition`.
+
+    Args:
+        start (int): First row
+        end (int): Row after the last row
+        top_k (int): Number of neighbours
+
+    Returns:
+        List[Tuple[int, int, float]]: Row, neighbour row and score, best first
+    """
+
+    indptr, indices, data = MATRIX["indptr"], MATRIX["indices"], MATRIX["data"]
+    count = len(indptr) - 1
+
+    # Dense transposed block, terms x block rows
+    block = np.zeros((MATRIX["columns"], end - start), dtype=np.float32)
+    span = slice(indptr[start], indptr[end])
+    block[indices[span], MATRIX["rows"][span] - start] = data[span]
+
+    # Sum the products of each row, reduceat needs non-empty segments
+    scores = np.zeros((count, end - start), dtype=np.float32)
+    filled = np.diff(indptr) > 0
+    scores[filled] = np.add.reduceat(
+        data[:, None] * block[indices], indptr[:-1][filled], axis=0
+    )
+
+    # A document is not its own neighbour
+    scores[np.arange(start, end), np.arange(end - start)] = -1
+
+    k = min(top_k, count - 1)
+    best = np.argpartition(-scores, k - 1, axis=0)[:k]
+    ranked = np.take_along_axis(
+        best, np.argsort(-np.take_along_axis(scores, best, axis=0), axis=0), axis=0
+    )
+
+    return [
+        (start + j, int(row), float(scores[row, j]))
+        for j in range(end - start)
+        for row in ranked[:, j]
+        if scores[row, j] > 0
+    ]
+
+
+def get_similar(
+    documents: List[Iterable[str]], top_k: int = 10, jobs: int = 1
+) -> Iterator[Tuple[int, int, int, float]]:
+    """
+    Computes the top-k most similar documents of every document, one block of
+    rows at a time. The TF-IDF matrix of all the documents is held in memory.
+
+    Args:
+        documents (List[Iterable[str]]): Terms of each document
+        top_k (int): Number of neighbours
+        jobs (int): Number of processes, each one computes blocks of rows
+
+    Yields:
+        Tuple[int, int, int, float]: Row, neighbour row, rank and score
+    """
+
+    matrix = get_tfidf(documents)
+    blocks = [
+        (start, min(start + BLOCK_SIZE, len(documents)))
+        for start in range(0, len(documents), BLOCK_SIZE)
+    ]
+
+    with ExitStack() as stack:
+        if jobs > 1:
+            executor = stack.enter_context(
+                ProcessPoolExecutor(jobs, initializer=set_matrix, initargs=matrix)
+            )
+            results = executor.map(get_neighbours, *zip(*blocks), [top_k] * len(blocks))
+
+        else:
+            set_matrix(*matrix)
+            results = (get_neighbours(start, end, top_k) for start, end in blocks)
+
+        rank, previous = 0, None
+        for row, neighbour, score in (item for result in results for item in result):
+            rank = rank + 1 if row == previous else 1
+            previous = row
+            yield row, neighbour, rank, score
@@ -0,0 +1,95 @@
+"""Synthetic languages, collections and items for load tests"""
+
+from itertools import accumulate, product
+import random
+from string import ascii_lowercase
+from typing import List, Sequence, Set, Tuple
+
+
+# Constants
+SYLLABLES = [c + v for c in "bdfghklmnprstvz" for v in "aeiou"]
+VOCABULARY_SIZE = 2000
+
+# Collection types (translation, transliteration, interpretation) and the
+# number of words of their items per word of the verse
+TYPES = {0: ("Translation", 1.5), 1: ("Transliteration", 1.0), 2: ("Tafsir", 6.0)}
+
+
+def get_language_codes(count: int, existing: Set[str]) -> List[str]:
+    """
+    Returns unused two letter language codes.
+
+    Args:
+        count (int): Number of codes
+        existing (Set[str]): Codes already in use
+
+    Returns:
+        List[str]: Language codes
+    """
+
+    codes = [
+        code
+        for code in ("".join(letters) for letters in product(ascii_lowercase, repeat=2))
+        if code not in existing
+    ]
+
+    if count > len(codes):
+        raise ValueError(f"At most {len(codes)} languages can be added")
+
+    return codes[:count]
+
+
+def get_vocabulary(seed: int) -> List[str]:
+    """
+    Builds the pseudo-words of a language.
+
+    Args:
+        seed (int): Random seed of the language
+
+    Returns:
+        List[str]: Words, the first ones are the most frequent
+    """
+
+    rng = random.Random(seed)
+
+    return [
+        "".join(rng.choices(SYLLABLES, k=rng.randint(1, 4)))
+        for _ in range(VOCABULARY_SIZE)
+    ]
+
+
+def get_items(
+    verses: Sequence[Tuple[int, int]],
+    vocabulary: List[str],
+    ratio: float,
+    seed: int,
+) -> List[Tuple[str, int]]:
+    """
+    Generates the items of a collection, one per verse, with a length following
+    the length of the verse and a Zipf-like word distribution.
+
+    Args:
+        verses (Sequence[Tuple[int, int]]): Verse id and word count
+        vocabulary (List[str]): Words of the language
+        ratio (float): Item words per verse word
+        seed (int): Random seed of the collection
+
+    Returns:
+        List[Tuple[str, int]]: Item content and verse id
+    """
+
+    rng = random.Random(seed)
+    weights = list(accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    return [
+        (
+            " ".join(
+                rng.choices(
+                    vocabulary, cum_weights=weights, k=max(1, round(words * ratio))
+                )
+            ).capitalize()
+            + ".",
+            verse_id,
+        )
+        for verse_id, words in verses
+    ]
@@ -1,18 +1,78 @@
 """Utility functions"""
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from itertools import chain, groupby, islice
 import json
 import os
+import re
 from pathlib import Path
 import shutil
 import sqlite3
-from typing import List, Literal, Optional, Tuple
+import tempfile
+import unicodedata
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    TextIO,
+    Tuple,
+)
 from rich import print
 
+from quran_cli import memory, similarity, synthetic
+from quran_cli.locator import get_locator
+
 
 # Constants
 PARENT = Path(__file__).parent
 INITIAL_SCHEMA = PARENT / "assets/schemas/initial.sql"
 
+INDEX_PROFILES = ("django", "reader", "analytics", "minimal")
+ITEMS_LAYOUTS = ("rowid", "clustered")
+
+# Rows per multi-row VALUES statement of the generated SQL
+SQL_BATCH_SIZE = 500
+
+# Estimated size of a fetched row, the fetches are sized by the memory budget with it
+ROW_BYTES = 1024
+
+# UPDATE ... FROM is available since SQLite 3.33
+UPDATE_FROM = sqlite3.sqlite_version_info >= (3, 33, 0)
+VALUES_COLUMN = re.compile(r'"v"\."column(\d+)"')
+
+# Collection id and data asset of each collection in assets/data/comp.sql
+COLLECTIONS = {1: "interpretations", 2: "translations", 3: "transliterations"}
+
+# Positions of the initial schema and items scripts of each collection in sql/workflow
+COLLECTION_SCRIPTS = {
+    "interpretations": (14, 18),
+    "translations": (19, 21),
+    "transliterations": (22, 24),
+}
+
+# Arabic-Indic digits of the verse number markers of the page texts
+ARABIC_DIGITS = str.maketrans(
+    "0123456789", "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669"
+)
+
+# Same replacements as the unaccent views, plus the tatweel (kashida)
+UNACCENT = str.maketrans(
+    {
+        **dict.fromkeys(
+            "\u06dc\u06e5\u06e6\u06da\u064d\u064c\u064b\u06e2\u06df\u06d7\u06d6"
+            "\u06ed\u06db\u0670\u0653\u0651\u0652\u0650\u064f\u064e\u0640"
+        ),
+        "\u0671": "\u0627",
+    }
+)
+
 
 def get_database_name(src: Path) -> str:
     """
@@ -40,19 +100,460 @@ def execute_sql_script(database: sqlite3.Cursor, script: str) -> None:
     database.executescript(script)
 
 
+def read_sql_chunks(path: Path, chunk_bytes: int) -> Iterator[str]:
+    """
+    Reads a SQL file in chunks of complete statements of about `chunk_bytes`,
+    a statement larger than that is a chunk of its own.
+
+    Args:
+        path (Path): SQL file path
+        chunk_bytes (int): Chunk size in characters
+
+    Yields:
+        str: SQL statements
+    """
+
+    chunk: List[str] = []
+    size = 0
+
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            chunk.append(line)
+            size += len(line)
+
+            if size < chunk_bytes or not line.rstrip().endswith(";"):
+                continue
+
+            script = "".join(chunk)
+            if sqlite3.complete_statement(script):
+                yield script
+                chunk, size = [], 0
+
+    if chunk:
+        yield "".join(chunk)
+
+
 def execute_sql_file(database: sqlite3.Cursor, path: Path) -> None:
     """
-    Executes a SQL file.
+    Executes a SQL file in chunks of statements sized by the memory budget.
 
     Args:
         database (sqlite3.Cursor): Database cursor
         file (str): SQL script filename
     """
 
-    with open(path, "r", encoding="utf-8") as file:
-        execute_sql_script(database, file.read())
+    for script in read_sql_chunks(path, memory.get_chunk_bytes()):
+        execute_sql_script(database, script)
+
+
+def to_sql_value(value: Any) -> str:
+    """
+    Converts a value to a SQL literal.
+
+    Args:
+        value (Any): Value
+
+    Returns:
+        str: SQL literal, strings are single quoted
+    """
+
+    if value is None:
+        return "NULL"
+
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+
+    return str(value)
+
+
+def fetch_rows(cursor: sqlite3.Cursor, row_bytes: int = ROW_BYTES) -> Iterator[Any]:
+    """
+    Streams the rows of a query in batches sized by the memory budget.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor of the executed query
+        row_bytes (int): Estimated size of a row in bytes
+
+    Yields:
+        Any: Rows
+    """
+
+    while rows := cursor.fetchmany(memory.get_batch_size(row_bytes)):
+        yield from rows
+
+
+def get_batches(rows: Iterable[Tuple]) -> Iterator[List[Tuple]]:
+    """
+    Splits rows into batches of `SQL_BATCH_SIZE` rows.
+
+    Args:
+        rows (Iterable[Tuple]): Rows
+
+    Yields:
+        List[Tuple]: Batch of rows
+    """
+
+    rows = iter(rows)
+    while batch := list(islice(rows, SQL_BATCH_SIZE)):
+        yield batch
+
+
+def get_batched_insert(
+    table: str, fields: List[str], rows: Iterable[Tuple]
+) -> Iterator[str]:
+    """
+    Builds multi-row INSERT statements of `SQL_BATCH_SIZE` rows, one batch at
+    a time.
+
+    Args:
+        table (str): Table name
+        fields (List[str]): Column names
+        rows (Iterable[Tuple]): Rows
+
+    Yields:
+        str: SQL statement
+    """
+
+    columns = ", ".join(f'"{field}"' for field in fields)
+
+    for batch in get_batches(rows):
+        yield (
+            f'INSERT INTO "{table}" ({columns}) VALUES\n'
+            + ",\n".join(
+                "  (" + ", ".join(to_sql_value(v) for v in row) + ")" for row in batch
+            )
+            + ";\n"
+        )
+
+
+def get_batched_update(
+    table: str, fields: List[str], rows: Iterable[Tuple], where: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Builds set-based `UPDATE ... FROM (VALUES ...)` statements of
+    `SQL_BATCH_SIZE` rows, the columns of the values are `column1`, `column2`...
+
+    SQLite older than 3.33 has no `UPDATE ... FROM`, one `UPDATE ... WHERE`
+    statement per row is built instead, with the values in place of the columns.
+
+    Args:
+        table (str): Table name
+        fields (List[str]): Columns set from the values, starting at `column2`
+        rows (Iterable[Tuple]): Rows, the id of the row to update then the values
+        where (str): Condition joining the table with the values, defaults to the
+        id of the table matching `column1`
+
+    Yields:
+        str: SQL statement
+    """
+
+    where = where or f'"{table}"."id" = "v"."column1"'
+    assignments = ", ".join(
+        f'"{field}" = "v"."column{i}"' for i, field in enumerate(fields, start=2)
+    )
+
+    if not UPDATE_FROM:
+        statement = f'UPDATE "{table}" SET {assignments} WHERE {where};\n'
+
+        for row in rows:
+            values = [to_sql_value(v) for v in row]
+            yield VALUES_COLUMN.sub(lambda match: values[int(match[1]) - 1], statement)
+
+        return
+
+    for batch in get_batches(rows):
+        yield (
+            f'UPDATE "{table}" SET {assignments} FROM (VALUES\n'
+            + ",\n".join(
+                "  (" + ", ".join(to_sql_value(v) for v in row) + ")" for row in batch
+            )
+            + f'\n) AS "v" WHERE {where};\n'
+        )
+
+
+@contextmanager
+def open_workflow(name: str, transaction: bool = True) -> Iterator[TextIO]:
+    """
+    Opens `sql/workflow/<name>.sql` to write generated SQL statements to.
+
+    Args:
+        name (str): Script name
+        transaction (bool): Weather to wrap the statements in a transaction
+
+    Yields:
+        TextIO: Script file
+    """
+
+    os.makedirs("sql/workflow", exist_ok=True)
+
+    with open(
+        f"sql/workflow/{name}.sql", "w", encoding="utf-8", newline="\n"
+    ) as output:
+        if transaction:
+            output.write("BEGIN;\n")
+
+        yield output
+
+        if transaction:
+            output.write("COMMIT;\n")
+
 
+def write_workflow(name: str, statements: str, transaction: bool = True) -> None:
+    """
+    Writes generated SQL statements to `sql/workflow/<name>.sql`.
+
+    Args:
+        name (str): Script name
+        statements (str): SQL statements, ending with a new line
+        transaction (bool): Weather to wrap the statements in a transaction
+    """
+
+    with open_workflow(name, transaction) as output:
+        output.write(statements)
+
+
+def execute_statements(
+    database: sqlite3.Cursor, statements: Iterable[str], name: Optional[str] = None
+) -> None:
+    """
+    Executes SQL statements one at a time, writing them to the workflow script
+    `name` as well when it is set (see `write_workflow`).
+
+    Args:
+        database (sqlite3.Cursor): Database cursor
+        statements (Iterable[str]): SQL statements, ending with a new line
+        name (Optional[str]): Workflow script name
+    """
+
+    with ExitStack() as stack:
+        output = stack.enter_context(open_workflow(name)) if name else None
+
+        for statement in statements:
+            if output is not None:
+                output.write(statement)
+
+            execute_sql_script(database, statement)
 
+
+def map_chunks(
+    function: Callable[[Any], Any], chunks: Iterable[Any], jobs: int = 1
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    Maps a function over chunks of work, in a process pool when `jobs` is more
+    than 1, with at most two chunks per process in flight. The memory budget is
+    passed to the processes.
+
+    Args:
+        function (Callable[[Any], Any]): Function, run with each chunk
+        chunks (Iterable[Any]): Chunks of work
+        jobs (int): Number of processes
+
+    Yields:
+        Tuple[Any, Any]: Each chunk and its result, in order
+    """
+
+    if jobs <= 1:
+        for chunk in chunks:
+            yield chunk, function(chunk)
+
+        return
+
+    with ProcessPoolExecutor(
+        jobs, initializer=memory.set_budget, initargs=(memory.SETTINGS["budget"],)
+    ) as executor:
+        pending: deque = deque()
+
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(function, chunk)))
+
+            if len(pending) >= 2 * jobs:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+
+        while pending:
+            chunk, future = pending.popleft()
+            yield chunk, future.result()
+
+
+@memory.track
+def consolidate_workflow() -> None:
+    """
+    Concatenates the scripts of `sql/workflow` in order into `sql/workflow.sql`,
+    in chunks sized by the memory budget.
+    """
+
+    print("Consolidating [bold]the workflow[/bold]...", end=" ")
+
+    with open("sql/workflow.sql", "w", encoding="utf-8", newline="\n") as output:
+        for path in sorted(Path("sql/workflow").glob("*.sql")):
+            output.write(f"-- {path.name}\n")
+
+            # Trailing whitespace is held back until more text follows, so only
+            # the end of each script is trimmed
+            blank = ""
+            with open(path, "r", encoding="utf-8") as script:
+                while chunk := script.read(memory.get_chunk_bytes()):
+                    text = blank + chunk
+                    content = text.rstrip()
+
+                    output.write(content)
+                    blank = text[len(content) :]
+
+            output.write("\n\n")
+
+    print("[bold green]Done[/bold green]")
+
+
+@contextmanager
+def open_database(path: Path, in_memory: bool = False) -> Iterator[sqlite3.Connection]:
+    """
+    Opens a database connection, commits and closes it when the block succeeds.
+
+    When `in_memory` is true, the existing database (if any) is copied into an
+    in-memory database, the block runs against that copy and the result is
+    published with the backup API to a temporary file that is renamed over `path`.
+    Readers never observe intermediate states and a failure leaves `path` untouched,
+    publishing is refused while another connection has `path` open in WAL mode.
+
+    Args:
+        path (Path): Database file path
+        in_memory (bool): Weather to build the database in memory
+
+    Yields:
+        sqlite3.Connection: Database connection
+    """
+
+    if not in_memory:
+        connection = sqlite3.connect(path)
+        memory.configure_connection(connection)
+
+        try:
+            yield connection
+            connection.commit()
+
+        finally:
+            connection.close()
+
+        return
+
+    connection = sqlite3.connect(":memory:")
+    memory.configure_connection(connection)
+
+    try:
+        if os.path.exists(path):
+            source = sqlite3.connect(path)
+            source.backup(connection)
+            source.close()
+
+        yield connection
+        connection.commit()
+        publish_database(connection, path)
+
+    finally:
+        connection.close()
+
+
+def release_database(path: Path) -> str:
+    """
+    Checkpoints the WAL of `path` into the database file and leaves WAL mode, so
+    no `-wal` or `-shm` file is left to be applied to a file renamed over it.
+
+    Args:
+        path (Path): Database file path
+
+    Raises:
+        RuntimeError: Another connection has the database open
+
+    Returns:
+        str: Journal mode of the database before it was released
+    """
+
+    connection = sqlite3.connect(path, timeout=0)
+
+    try:
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+        if journal_mode.lower() == "wal":
+            busy = connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()[0]
+
+            # Leaving WAL mode needs every other connection to be closed
+            mode = connection.execute("PRAGMA journal_mode = DELETE").fetchone()[0]
+
+            if busy or mode.lower() != "delete":
+                raise sqlite3.OperationalError("database is locked")
+
+    except sqlite3.OperationalError as error:
+        raise RuntimeError(
+            f"{path} is open in another connection, close it before publishing"
+        ) from error
+
+    finally:
+        connection.close()
+
+    return journal_mode
+
+
+def publish_database(connection: sqlite3.Connection, path: Path) -> None:
+    """
+    Atomically replaces `path` with the contents of `connection`.
+
+    The published file is in WAL mode when `path` was or when the build applied
+    the normalized schema (which enables it), like a build made on disk.
+
+    Args:
+        connection (sqlite3.Connection): Source database connection
+        path (Path): Database file path
+
+    Raises:
+        RuntimeError: Another connection has `path` open in WAL mode
+    """
+
+    journal_mode = release_database(path) if os.path.exists(path) else "delete"
+    normalized = connection.execute(
+        'SELECT 1 FROM "sqlite_master" WHERE "type" = \'table\' '
+        "AND \"name\" = 'chapters'"
+    ).fetchone()
+    wal = journal_mode.lower() == "wal" or normalized is not None
+
+    fd, temp = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)),
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp",
+    )
+    os.close(fd)
+
+    try:
+        target = sqlite3.connect(temp)
+        connection.backup(target)
+        if wal:
+            target.execute("PRAGMA journal_mode = WAL")
+        target.close()
+
+        # mkstemp creates the file with 0600, keep the mode a new file would get
+        if os.path.exists(path):
+            mode = os.stat(path).st_mode & 0o777
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+
+        os.chmod(temp, mode)
+        os.replace(temp, path)
+
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+        # Put back the WAL mode `release_database` left
+        if journal_mode.lower() == "wal":
+            target = sqlite3.connect(path)
+            target.execute("PRAGMA journal_mode = WAL")
+            target.close()
+
+        raise
+
+
+@memory.track
 def apply_initial_schema(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     """
     Creates the initial schema to insert Quran text.
@@ -71,6 +572,7 @@ def apply_initial_schema(database: sqlite3.Cursor, generate_sql: bool = False) -
     print("[bold green]Done[/bold green]")
 
 
+@memory.track
 def create_views(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     """
     Creates views to help with data access.
@@ -83,13 +585,14 @@ def create_views(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     views = PARENT / "assets/schemas/views.sql"
 
     if generate_sql:
-        shutil.copyfile(views, "sql/workflow/11-views.sql")
+        shutil.copyfile(views, "sql/workflow/12-views.sql")
 
     print("Creating [bold]the views[/bold]...", end=" ")
     execute_sql_file(database, views)
     print("[bold green]Done[/bold green]")
 
 
+@memory.track
 def insert_initial_data(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     """
     Inserts the Quran text into the database
@@ -109,6 +612,7 @@ def insert_initial_data(database: sqlite3.Cursor, generate_sql: bool = False) ->
     print("[bold green]Done[/bold green]")
 
 
+@memory.track
 def apply_normalized_schema(
     database: sqlite3.Cursor, generate_sql: bool = False
 ) -> None:
@@ -131,6 +635,7 @@ def apply_normalized_schema(
     print("[bold green]Done[/bold green]")
 
 
+@memory.track
 def insert_chapters(
     database: sqlite3.Cursor,
     with_diacritics: bool = False,
@@ -147,34 +652,63 @@ def insert_chapters(
 
     chapters = PARENT / "assets/data/chapters.sql"
 
-    if generate_sql:
-        shutil.copyfile(chapters, "sql/workflow/04-chapters.sql")
-
     print("Inserting [bold]chapters[/bold]...", end=" ")
     execute_sql_file(database, chapters)
 
+    statements = ""
     if with_diacritics:
         src = PARENT / "assets/data/chapters.json"
 
         with open(src, encoding="utf-8") as f:
             statements = "".join(
-                [
-                    f'UPDATE "chapters" SET "name" = "{chapter['new_name']}" WHERE "id" = {chapter['id']};\n'
-                    for chapter in json.load(f)
-                ]
+                get_batched_update(
+                    "chapters",
+                    ["name"],
+                    [(chapter["id"], chapter["new_name"]) for chapter in json.load(f)],
+                )
             )
 
-            if generate_sql:
-                with open(
-                    "sql/workflow/04-chapters.sql", "a", encoding="utf-8"
-                ) as output:
-                    output.write("\n\n" + statements)
+        execute_sql_script(database, statements)
 
-            execute_sql_script(database, statements)
+    if generate_sql:
+        with open(chapters, "r", encoding="utf-8") as src:
+            write_workflow("04-chapters", src.read().rstrip() + "\n" + statements)
 
     print("[bold green]Done[/bold green]")
 
 
+def unaccent(text: str) -> str:
+    """
+    Removes Arabic diacritics and Quranic annotation marks from a text.
+
+    Args:
+        text (str): Arabic text
+
+    Returns:
+        str: Text without diacritics
+    """
+
+    return text.translate(UNACCENT)
+
+
+def get_words(text: str) -> List[str]:
+    """
+    Splits a verse into words, standalone pause and section marks are skipped.
+
+    Args:
+        text (str): Verse content
+
+    Returns:
+        List[str]: Words of the verse
+    """
+
+    return [
+        word
+        for word in text.split()
+        if any(unicodedata.category(char) == "Lo" for char in word)
+    ]
+
+
 def get_verse(
     database: sqlite3.Cursor,
     chapter_id: int,
@@ -207,7 +741,7 @@ def get_verse_range(
     Get the verse range as (start_verse_id, end_verse_id).
 
     Args:
-        database (sqlite3.Cursor): Database cursor
+        database (sqlite3.Cursor): Database cursor, not used, ids come from the locator
         start (Tuple[int, int]): Start chapter_id and verse_number
         end (Tuple[int, int]): End chapter_id and verse_number
 
@@ -215,45 +749,31 @@ def get_verse_range(
         Tuple[int, int]: Tuple with the start and end verse ids
     """
 
-    return (
-        get_verse(database, start[0], start[1])[0],
-        get_verse(database, end[0], end[1])[0] - 1,
-    )
+    locator = get_locator()
+
+    return locator.verse_id(*start), locator.verse_id(*end) - 1
 
 
 def get_table_verse_range(
     database: sqlite3.Cursor,
-    table: Literal["parts", "pages", "quarters"],
+    table: Literal["parts", "groups", "pages", "quarters"],
 ) -> List[Tuple[int, int]]:
     """
-    Get verse ranges for each part, quarter and page as (start_verse_id, end_verse_id).
+    Get verse ranges for each part, group, quarter and page as (start_verse_id, end_verse_id).
     The index of the item in the returned list represents the id of the part, quarter or page.
 
     Args:
-        database (sqlite3.Cursor): Database cursor
+        database (sqlite3.Cursor): Database cursor, not used, ranges come from the locator
         table (str): Table name
 
     Returns:
         List[Tuple[int, int]]: Verse range representation of each item in the list.
     """
 
-    with open(
-        PARENT / "assets/data/metadata.json",
-        "r",
-        encoding="utf-8",
-    ) as file:
-        data = json.load(file)[table]
-
-        res = []
-        for index, item in enumerate(data):
-            if index < len(data) - 1:
-                res.append(get_verse_range(database, item, data[index + 1]))
-            else:
-                res.append((res[-1][1] + 1, 6236))
-
-        return res
+    return get_locator().ranges(table)
 
 
+@memory.track
 def insert_verses(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     """
     Insert verses (Al-Aayat) data into the database.
@@ -266,14 +786,14 @@ def insert_verses(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     statement = 'INSERT INTO "verses" ("number", "content", "chapter_id") SELECT "number", "content", "chapter_id" FROM "quran";'
 
     if generate_sql:
-        with open("sql/workflow/05-verses.sql", "w", encoding="utf-8") as output:
-            output.write(statement)
+        write_workflow("05-verses", statement + "\n")
 
     print("Inserting [bold]verses[/bold]...", end=" ")
     execute_sql_script(database, statement)
     print("[bold green]Done[/bold green]")
 
 
+@memory.track
 def insert_table_data(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     """
     Insert data into parts, groups, quarters and pages tables.
@@ -283,39 +803,27 @@ def insert_table_data(database: sqlite3.Cursor, generate_sql: bool = False) -> N
         generate_sql (bool): Weather to generate SQL statements
     """
 
-    statements = "".join(
-        [
-            *[
-                f'INSERT INTO "parts" (name) VALUES ("الجزء {p}");\n'
-                for p in range(1, 31)
-            ],
-            *[
-                f'INSERT INTO "groups" (name) VALUES ("الحزب {g}");\n'
-                for g in range(1, 61)
-            ],
-            *[
-                f'INSERT INTO "quarters" (name) VALUES ("الربع {q}");\n'
-                for q in range(1, 241)
-            ],
-            *[
-                f'INSERT INTO "pages" (name) VALUES ("الصفحة {p}");\n'
-                for p in range(1, 605)
-            ],
+    statements = chain.from_iterable(
+        get_batched_insert(
+            table, ["name"], ((f"{name} {i}",) for i in range(1, count + 1))
+        )
+        for table, name, count in [
+            ("parts", "الجزء", 30),
+            ("groups", "الحزب", 60),
+            ("quarters", "الربع", 240),
+            ("pages", "الصفحة", 604),
         ]
     )
 
-    if generate_sql:
-        with open("sql/workflow/06-tables.sql", "w", encoding="utf-8") as output:
-            output.write(statements)
-
     print(
         "Inserting data into [bold]parts, groups, quarters and pages tables[/bold]...",
         end=" ",
     )
-    execute_sql_script(database, statements)
+    execute_statements(database, statements, "06-tables" if generate_sql else None)
     print("[bold green]Done[/bold green]")
 
 
+@memory.track
 def set_verse_fks(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     """
     Update the verses table to set part_id, group_id, quarter_id and page_id.
@@ -331,51 +839,26 @@ def set_verse_fks(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
         end=" ",
     )
 
-    statements = [
-        "".join(
-            [
-                # Generate SQL statement for each range
-                f'UPDATE "verses" SET "{t[:-1]}_id" = {id} WHERE "id" BETWEEN {item[0]} AND {item[1]};\n'
-                for id, item in enumerate(get_table_verse_range(database, t), start=1)
-            ]
+    statements = chain.from_iterable(
+        # One row per item, its first verse, id and last verse
+        get_batched_update(
+            "verses",
+            [f"{t[:-1]}_id"],
+            (
+                (first, id, last)
+                for id, (first, last) in enumerate(get_locator().ranges(t), start=1)
+            ),
+            '"verses"."id" BETWEEN "v"."column1" AND "v"."column3"',
         )
-        # Generate verse ranges for each table
-        for t in ["parts", "quarters", "pages"]
-    ]
-
-    # Compute group ranges based on quarter ranges; Group = 4 Quarter
-    q_ranges = get_table_verse_range(database, "quarters")
-    statements.insert(
-        1,
-        "".join(
-            [
-                f'UPDATE "verses" SET group_id = {i} WHERE "id" BETWEEN {g[0]} AND {g[1]};\n'
-                for i, g in enumerate(
-                    # Compute group ranges
-                    [
-                        (
-                            q_ranges[i][0],
-                            q_ranges[i + 3][1] if i + 4 < len(q_ranges) - 1 else 6236,
-                        )
-                        for i in range(0, 240, 4)
-                    ],
-                    start=1,
-                )
-            ]
-        ),
+        for t in ["parts", "groups", "quarters", "pages"]
     )
 
-    statements = "".join(statements)
-
-    if generate_sql:
-        with open("sql/workflow/07-verse-fks.sql", "w", encoding="utf-8") as output:
-            output.write(statements)
-
-    execute_sql_script(database, statements)
+    execute_statements(database, statements, "07-verse-fks" if generate_sql else None)
 
     print("[bold green]Done[/bold green]")
 
 
+@memory.track
 def set_verse_count(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     """
     Update corresponding tables to set verse_count.
@@ -387,34 +870,27 @@ def set_verse_count(database: sqlite3.Cursor, generate_sql: bool = False) -> Non
 
     print("Setting [bold]verse_count[/bold]...", end=" ")
 
-    statements = "".join(
-        [
-            "".join(
-                [
-                    # Generate corresponding SQL statement
-                    f'UPDATE {t} SET "verse_count" = {item[0]} WHERE "id" = {id};\n'
-                    # Compute verse_count for each item in each table with item id
-                    for id, item in enumerate(
-                        database.execute(
-                            f'SELECT COUNT(*) FROM "verses" GROUP BY "{t[:-1]}_id"'
-                        ).fetchall(),
-                        start=1,
-                    )
-                ]
-            )
-            for t in ["parts", "groups", "quarters", "pages"]
-        ]
+    statements = chain.from_iterable(
+        get_batched_update(
+            t,
+            ["verse_count"],
+            # Compute verse_count for each item in each table with item id
+            fetch_rows(
+                database.connection.execute(
+                    f'SELECT "{t[:-1]}_id", COUNT(*) FROM "verses" '
+                    f'GROUP BY "{t[:-1]}_id" ORDER BY "{t[:-1]}_id"'
+                )
+            ),
+        )
+        for t in ["parts", "groups", "quarters", "pages"]
     )
 
-    if generate_sql:
-        with open("sql/workflow/08-verse-count.sql", "w", encoding="utf-8") as output:
-            output.write(statements)
-
-    execute_sql_script(database, statements)
+    execute_statements(database, statements, "08-verse-count" if generate_sql else None)
 
     print("[bold green]Done[/bold green]")
 
 
+@memory.track
 def set_page_count(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     """
     Update corresponding tables to set page_count.
@@ -426,32 +902,103 @@ def set_page_count(database: sqlite3.Cursor, generate_sql: bool = False) -> None
 
     print("Setting [bold]page_count[/bold]...", end=" ")
 
-    statements = "".join(
-        [
-            "".join(
-                [
-                    f'UPDATE {t} SET "page_count" = {item[0]} WHERE "id" = {id};\n'
-                    for id, item in enumerate(
-                        database.execute(
-                            'SELECT COUNT(DISTINCT "pages"."id") FROM "pages" INNER JOIN "verses" ON '
-                            f'("pages"."id" = "verses"."page_id") GROUP BY "verses"."{t[:-1]}_id"'
-                        ).fetchall(),
-                        start=1,
-                    )
-                ]
-            )
-            for t in ["chapters", "parts", "groups", "quarters"]
-        ]
+    statements = chain.from_iterable(
+        get_batched_update(
+            t,
+            ["page_count"],
+            fetch_rows(
+                database.connection.execute(
+                    f'SELECT "verses"."{t[:-1]}_id", COUNT(DISTINCT "pages"."id") '
+                    'FROM "pages" INNER JOIN "verses" '
+                    'ON ("pages"."id" = "verses"."page_id") '
+                    f'GROUP BY "verses"."{t[:-1]}_id" ORDER BY "verses"."{t[:-1]}_id"'
+                )
+            ),
+        )
+        for t in ["chapters", "parts", "groups", "quarters"]
     )
 
-    if generate_sql:
-        with open("sql/workflow/10-page-count.sql", "w", encoding="utf-8") as output:
-            output.write(str(statements))
+    execute_statements(database, statements, "10-page-count" if generate_sql else None)
+    print("[bold green]Done[/bold green]")
+
+
+def get_text_statistics(
+    verses: List[Tuple[Any, ...]],
+) -> List[Tuple[int, int, int, int]]:
+    """
+    Computes word, letter and character counts of verses.
+
+    Letters are Arabic letters only, diacritics, marks and spaces are not counted.
+
+    Args:
+        verses (List[Tuple[Any, ...]]): Verse ids and contents, then any other fields
+
+    Returns:
+        List[Tuple[int, int, int, int]]: Verse id, word_count, letter_count and character_count
+    """
+
+    return [
+        (
+            verse_id,
+            len(get_words(content)),
+            sum(unicodedata.category(char) == "Lo" for char in content),
+            len(content),
+        )
+        for verse_id, content, *_ in verses
+    ]
+
+
+@memory.track
+def set_text_statistics(
+    database: sqlite3.Cursor, generate_sql: bool = False, jobs: int = 1
+) -> None:
+    """
+    Update corresponding tables to set word_count, letter_count and character_count.
+
+    Args:
+        database (sqlite3.Cursor): Database cursor
+        generate_sql (bool): Weather to generate SQL statements
+        jobs (int): Number of processes to compute the statistics with, one chapter per task
+    """
+
+    print("Setting [bold]text statistics[/bold]...", end=" ")
+
+    units = ["chapters", "parts", "groups", "quarters", "pages"]
+    verses = fetch_rows(
+        database.connection.execute(
+            'SELECT "id", "content", "chapter_id", "part_id", "group_id", '
+            '"quarter_id", "page_id" FROM "verses" ORDER BY "id"'
+        )
+    )
+    chapters = (list(rows) for _, rows in groupby(verses, key=lambda row: row[2]))
+
+    # Totals of each unit, the verses are read and counted one chapter at a time
+    totals: Dict[str, Dict[int, List[int]]] = {table: {} for table in units}
+    for rows, results in map_chunks(get_text_statistics, chapters, jobs):
+        for row, (_, *counts) in zip(rows, results):
+            for table, id in zip(units, row[2:]):
+                total = totals[table].setdefault(id, [0, 0, 0])
+
+                for i, count in enumerate(counts):
+                    total[i] += count
+
+    statements = chain.from_iterable(
+        get_batched_update(
+            table,
+            ["word_count", "letter_count", "character_count"],
+            [(id, *counts) for id, counts in sorted(totals[table].items())],
+        )
+        for table in units
+    )
+
+    execute_statements(
+        database, statements, "11-text-statistics" if generate_sql else None
+    )
 
-    execute_sql_script(database, statements)
     print("[bold green]Done[/bold green]")
 
 
+@memory.track
 def set_foreign_keys(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
     """
     Update groups, quarters and pages tables to set foreign keys.
@@ -469,125 +1016,700 @@ def set_foreign_keys(database: sqlite3.Cursor, generate_sql: bool = False) -> No
     tables = [
         {
             "name": "groups",
-            "select": 'SELECT "part_id" FROM "verses" GROUP BY "group_id"',
-            "update": 'UPDATE "groups" SET "part_id" = %s WHERE "id" = %s;\n',
+            "fields": ["part_id"],
         },
         {
             "name": "quarters",
-            "select": 'SELECT "part_id", "group_id" FROM "verses" GROUP BY "quarter_id"',
-            "update": 'UPDATE "quarters" SET "part_id" = %s, "group_id" = %s WHERE "id" = %s;\n',
+            "fields": ["part_id", "group_id"],
         },
         {
             "name": "pages",
-            "select": 'SELECT "chapter_id", "part_id", "group_id", "quarter_id" FROM "verses" GROUP BY "page_id"',
-            "update": 'UPDATE "pages" SET "chapter_id" = %s, "part_id" = %s, "group_id" = %s, "quarter_id" = %s WHERE "id" = %s;\n',
+            "fields": ["chapter_id", "part_id", "group_id", "quarter_id"],
         },
     ]
 
-    statements = "".join(
-        [
-            "".join(
-                [
-                    t["update"] % (*item, id)
-                    for id, item in enumerate(
-                        database.execute(t["select"]).fetchall(), start=1
-                    )
-                ]
-            )
-            for t in tables
-        ]
+    statements = chain.from_iterable(
+        get_batched_update(
+            t["name"],
+            t["fields"],
+            fetch_rows(
+                database.connection.execute(
+                    f'SELECT "{t["name"][:-1]}_id", '
+                    + ", ".join(f'"{field}"' for field in t["fields"])
+                    + f' FROM "verses" GROUP BY "{t["name"][:-1]}_id" '
+                    f'ORDER BY "{t["name"][:-1]}_id"'
+                )
+            ),
+        )
+        for t in tables
     )
 
-    if generate_sql:
-        with open("sql/workflow/09-tables_fks.sql", "w", encoding="utf-8") as output:
-            output.write(statements)
-
-    execute_sql_script(database, statements)
+    execute_statements(database, statements, "09-tables-fks" if generate_sql else None)
 
     print("[bold green]Done[/bold green]")
 
 
-def insert_items(
+def get_items_statement(collection_id: int, source: str) -> str:
+    """
+    Builds the statement copying the verses of a `quran` table into the items
+    of a collection.
+
+    Ids are assigned after the last item, in verse order, as the clustered
+    items layout is a WITHOUT ROWID table that can not generate them.
+
+    Args:
+        collection_id (int): Collection ID
+        source (str): Quoted name of the `quran` table to read the items from
+
+    Returns:
+        str: SQL statement
+    """
+
+    return (
+        'INSERT INTO "items" ("id", "content", "collection_id", "verse_id") '
+        'SELECT (SELECT COALESCE(MAX("id"), 0) FROM "items") + "id", '
+        f'"content", {collection_id}, "id" FROM {source} ORDER BY "id";'
+    )
+
+
+def normalize_database(
     database: sqlite3.Cursor,
-    collection_id: int,
+    with_diacritics: bool = False,
     generate_sql: bool = False,
-    file_name: Optional[str] = None,
+    words: bool = False,
+    jobs: int = 1,
+    page_texts: bool = False,
 ) -> None:
     """
-    Insert items data into the database.
+    Runs all normalization steps on an initialized database.
 
     Args:
         database (sqlite3.Cursor): Database cursor
-        collection_id (int): Collection ID
+        with_diacritics (bool): Weather to include arabic diacritics in chapter names
         generate_sql (bool): Weather to generate SQL statements
-        file_name (str): File name to write if generate_sql is true
+        words (bool): Weather to build the words (concordance) table
+        jobs (int): Number of processes to compute text statistics with
+        page_texts (bool): Weather to build the page_texts table
     """
 
-    statement = f'INSERT INTO "items"("content", "collection_id", "verse_id") SELECT "content", {collection_id}, "id" FROM "quran"'
+    apply_normalized_schema(database, generate_sql)
+    insert_chapters(database, with_diacritics, generate_sql)
+    insert_verses(database, generate_sql)
+    insert_table_data(database, generate_sql)
+    set_verse_fks(database, generate_sql)
+    set_verse_count(database, generate_sql)
+    set_foreign_keys(database, generate_sql)
+    set_page_count(database, generate_sql)
+    set_text_statistics(database, generate_sql, jobs)
+    create_views(database, generate_sql)
 
-    if generate_sql and file_name:
-        with open(f"sql/workflow/{file_name}.sql", "a", encoding="utf-8") as output:
-            output.write(statement)
+    if words:
+        insert_words(database, generate_sql)
+
+    if page_texts:
+        insert_page_texts(database, generate_sql)
+
+
+def apply_index_profile(database: sqlite3.Cursor, profile: str) -> None:
+    """
+    Replaces the secondary indexes with those of an index profile
+    (see `assets/schemas/indexes`). Unique indexes are kept since they enforce
+    constraints, indexes of tables that do not exist are skipped.
+
+    Args:
+        database (sqlite3.Cursor): Database cursor
+        profile (str): Index profile, one of `INDEX_PROFILES`
+    """
+
+    if profile not in INDEX_PROFILES:
+        raise ValueError(f"Unknown index profile {profile!r}")
+
+    print(f"Applying [bold]{profile}[/bold] index profile...", end=" ")
+
+    tables = {
+        row[0]
+        for row in database.execute(
+            "SELECT \"name\" FROM \"sqlite_master\" WHERE \"type\" = 'table'"
+        ).fetchall()
+    }
+
+    with open(
+        PARENT / f"assets/schemas/indexes/{profile}.sql", "r", encoding="utf-8"
+    ) as file:
+        statements = [
+            line
+            for line in file
+            if (match := re.match(r'CREATE INDEX "\w+" ON "(\w+)"', line))
+            and match.group(1) in tables
+        ]
+
+    drops = [
+        f'DROP INDEX "{name}";\n'
+        for name, sql in database.execute(
+            "SELECT \"name\", \"sql\" FROM \"sqlite_master\" WHERE \"type\" = 'index'"
+        ).fetchall()
+        if sql and not sql.startswith("CREATE UNIQUE")
+    ]
+
+    execute_sql_script(database, "".join([*drops, *statements, "ANALYZE;\n"]))
 
-    print("Inserting [bold]items[/bold]...", end=" ")
-    execute_sql_script(database, statement)
     print("[bold green]Done[/bold green]")
 
 
-def insert_interpretations(
-    database: sqlite3.Cursor, generate_sql: bool = False
+def apply_items_layout(database: sqlite3.Cursor, layout: str) -> None:
+    """
+    Rebuilds the items table with a storage layout (see
+    `assets/schemas/layouts`), keeping its ids and indexes.
+
+    The clustered layout is a `WITHOUT ROWID` table ordered by
+    `(collection_id, verse_id)`, it requires every item to have a verse and new
+    items to be inserted with their id, so it is applied after loading.
+
+    Args:
+        database (sqlite3.Cursor): Database cursor
+        layout (str): Items layout, one of `ITEMS_LAYOUTS`
+    """
+
+    if layout not in ITEMS_LAYOUTS:
+        raise ValueError(f"Unknown items layout {layout!r}")
+
+    if (
+        layout == "clustered"
+        and database.execute(
+            'SELECT COUNT(*) FROM "items" WHERE "verse_id" IS NULL'
+        ).fetchone()[0]
+    ):
+        raise ValueError("The clustered layout requires every item to have a verse")
+
+    print(f"Applying [bold]{layout}[/bold] items layout...", end=" ")
+
+    indexes = [
+        f"{sql};\n"
+        for (sql,) in database.execute(
+            "SELECT \"sql\" FROM \"sqlite_master\" WHERE \"type\" = 'index' "
+            "AND \"tbl_name\" = 'items' AND \"sql\" IS NOT NULL"
+        ).fetchall()
+    ]
+    order = '"id"' if layout == "rowid" else '"collection_id", "verse_id", "id"'
+    fields = '"id", "content", "chapter_id", "collection_id", "verse_id"'
+
+    with open(
+        PARENT / f"assets/schemas/layouts/{layout}.sql", "r", encoding="utf-8"
+    ) as file:
+        schema = file.read()
+
+    execute_sql_script(
+        database,
+        "BEGIN;\n"
+        + schema
+        + f'INSERT INTO "items_layout" ({fields}) SELECT {fields} FROM "items" '
+        f"ORDER BY {order};\n"
+        'DROP TABLE "items";\n'
+        'ALTER TABLE "items_layout" RENAME TO "items";\n'
+        + "".join(indexes)
+        + "COMMIT;\n"
+        'ANALYZE "items";\n',
+    )
+
+    print("[bold green]Done[/bold green]")
+
+
+def load_collection_shard(name: str, path: str) -> str:
+    """
+    Parses a collection asset into the `quran` table of a new shard database.
+
+    Args:
+        name (str): Collection asset, a value of `COLLECTIONS`
+        path (str): Shard database file
+
+    Returns:
+        str: Shard database file
+    """
+
+    connection = sqlite3.connect(path)
+    memory.configure_connection(connection)
+    cursor = connection.cursor()
+
+    execute_sql_script(
+        cursor, 'PRAGMA "journal_mode" = OFF;\nPRAGMA "synchronous" = OFF;'
+    )
+    execute_sql_file(cursor, INITIAL_SCHEMA)
+    execute_sql_file(cursor, PARENT / f"assets/data/{name}.sql")
+
+    connection.commit()
+    connection.close()
+
+    return path
+
+
+@memory.track
+def load_collection_shards(directory: str, jobs: int = 1) -> Dict[str, str]:
+    """
+    Parses every collection asset into its own shard database, one process per
+    collection.
+
+    Args:
+        directory (str): Folder of the shard databases
+        jobs (int): Number of processes to parse the collections with
+
+    Returns:
+        Dict[str, str]: Shard database file of each collection asset
+    """
+
+    paths = {
+        name: os.path.join(directory, f"{name}.sqlite3")
+        for name in COLLECTIONS.values()
+    }
+
+    print("Parsing [bold]collections[/bold]...", end=" ")
+
+    if jobs > 1:
+        with ProcessPoolExecutor(
+            min(jobs, len(paths)),
+            initializer=memory.set_budget,
+            initargs=(memory.SETTINGS["budget"],),
+        ) as executor:
+            list(executor.map(load_collection_shard, paths, paths.values()))
+
+    else:
+        for name, path in paths.items():
+            load_collection_shard(name, path)
+
+    print("[bold green]Done[/bold green]")
+
+    return paths
+
+
+@memory.track
+def merge_collection_shards(database: sqlite3.Cursor, paths: Dict[str, str]) -> None:
+    """
+    Inserts languages and collections, then attaches the shards created by
+    `load_collection_shards` and merges them into items with one
+    `INSERT ... SELECT` each, in collection order.
+
+    Args:
+        database (sqlite3.Cursor): Database cursor
+        paths (Dict[str, str]): Shard database file of each collection asset
+    """
+
+    print("Merging [bold]collections[/bold]...", end=" ")
+    execute_sql_file(database, PARENT / "assets/schemas/comp.sql")
+    execute_sql_file(database, PARENT / "assets/data/comp.sql")
+
+    for collection_id, name in COLLECTIONS.items():
+        execute_sql_script(
+            database,
+            f'ATTACH DATABASE {to_sql_value(paths[name])} AS "shard";\n'
+            + get_items_statement(collection_id, '"shard"."quran"')
+            + "\n",
+        )
+        execute_sql_script(database, 'DETACH DATABASE "shard";')
+
+    print("[bold green]Done[/bold green]")
+
+
+@memory.track
+def insert_collections(
+    database: sqlite3.Cursor, generate_sql: bool = False, jobs: int = 1
 ) -> None:
     """
-    Insert interpretations (Tafsir) data into the database.
+    Insert interpretations, translations and transliterations into the database.
+
+    Each collection is parsed in its own process into a temporary shard
+    database, the shards are then attached and merged into items.
 
     Args:
         database (sqlite3.Cursor): Database cursor
         generate_sql (bool): Weather to generate SQL statements
+        jobs (int): Number of processes to parse the collections with
     """
 
-    initial_data = PARENT / "assets/data/interpretations.sql"
-    schema = PARENT / "assets/schemas/comp.sql"
-    data = PARENT / "assets/data/comp.sql"
-
     if generate_sql:
         os.makedirs("sql/workflow", exist_ok=True)
-        shutil.copyfile(INITIAL_SCHEMA, "sql/workflow/12-initial-schema.sql")
-        shutil.copyfile(initial_data, "sql/workflow/13-interpretations-initial.sql")
-        shutil.copyfile(schema, "sql/workflow/14-comp-schema.sql")
-        shutil.copyfile(data, "sql/workflow/15-comp-data.sql")
+        shutil.copyfile(
+            PARENT / "assets/schemas/comp.sql", "sql/workflow/16-comp-schema.sql"
+        )
+        shutil.copyfile(
+            PARENT / "assets/data/comp.sql", "sql/workflow/17-comp-data.sql"
+        )
 
-    print("Inserting [bold]interpretations[/bold]...")
-    apply_initial_schema(database)
-    execute_sql_file(database, initial_data)
+        # The workflow parses each collection into the quran table, then copies it
+        for collection_id, name in COLLECTIONS.items():
+            schema, items = COLLECTION_SCRIPTS[name]
+            shutil.copyfile(INITIAL_SCHEMA, f"sql/workflow/{schema}-initial-schema.sql")
+            shutil.copyfile(
+                PARENT / f"assets/data/{name}.sql",
+                f"sql/workflow/{schema + 1}-{name}-initial.sql",
+            )
+            write_workflow(
+                f"{items}-{name}", get_items_statement(collection_id, '"quran"') + "\n"
+            )
+
+    with tempfile.TemporaryDirectory() as directory:
+        merge_collection_shards(database, load_collection_shards(directory, jobs))
+
+
+def get_word_rows(
+    connection: sqlite3.Connection,
+) -> Iterator[Tuple[int, str, str, int]]:
+    """
+    Tokenizes the verses into words rows as they are read.
+
+    Args:
+        connection (sqlite3.Connection): Database connection, the verses are read
+        from their own cursor
+
+    Yields:
+        Tuple[int, str, str, int]: Position, content, unaccented content and verse id
+    """
+
+    for verse_id, content in fetch_rows(
+        connection.execute('SELECT "id", "content" FROM "verses" ORDER BY "id"')
+    ):
+        for position, word in enumerate(get_words(content), start=1):
+            yield position, word, unaccent(word), verse_id
+
+
+@memory.track
+def insert_words(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
+    """
+    Tokenize verses into the words table (concordance).
+
+    Pause marks that stand alone between words are not counted as words.
+
+    Args:
+        database (sqlite3.Cursor): Database cursor
+        generate_sql (bool): Weather to generate SQL statements
+    """
+
+    schema = PARENT / "assets/schemas/words.sql"
+    indexes = (
+        'CREATE UNIQUE INDEX "words_verse_id_position_5cbc77aa_uniq" '
+        'ON "words" ("verse_id", "position");\n'
+        'CREATE INDEX "words_content_ccca0141" ON "words" ("content");\n'
+        'CREATE INDEX "words_unaccent_content_2771559e" '
+        'ON "words" ("unaccent_content");\n'
+    )
+
+    print("Inserting [bold]words[/bold]...", end=" ")
     execute_sql_file(database, schema)
-    execute_sql_file(database, data)
-    insert_items(database, 1, generate_sql, "16-interpretations")
 
+    statement = (
+        'INSERT INTO "words" ("position", "content", "unaccent_content", "verse_id") '
+        "VALUES (?, ?, ?, ?)"
+    )
+
+    # One implicit transaction for all rows, indexes are built after loading
+    database.executemany(statement, get_word_rows(database.connection))
+    execute_sql_script(database, indexes)
+
+    # The words are tokenized again for the script rather than kept in memory
+    if generate_sql:
+        with open(schema, "r", encoding="utf-8") as src, open_workflow(
+            "13-words", transaction=False
+        ) as output:
+            output.write(src.read().rstrip() + "\n\nBEGIN;\n")
+
+            for batch in get_batched_insert(
+                "words",
+                ["position", "content", "unaccent_content", "verse_id"],
+                get_word_rows(database.connection),
+            ):
+                output.write(batch)
 
-def insert_trans(database: sqlite3.Cursor, generate_sql: bool = False) -> None:
+            output.write("COMMIT;\n\n" + indexes)
+
+    print("[bold green]Done[/bold green]")
+
+
+def get_page_text(
+    verses: List[Tuple[int, int, str]], markers: bool = True
+) -> Tuple[str, List[Tuple[int, int, int]]]:
     """
-    Insert translation and transliteration data into database.
+    Assembles the text of a page and the offsets of its verses.
+
+    Args:
+        verses (List[Tuple[int, int, str]]): Verse id, verse number and text
+        markers (bool): Weather to end verses with a ﴿number﴾ marker, otherwise
+        verses are separated with new lines
+
+    Returns:
+        Tuple[str, List[Tuple[int, int, int]]]: Page text and the verse id, start
+        and end (exclusive) character offsets of each verse
+    """
+
+    parts, offsets, position = [], [], 0
+
+    for verse_id, number, content in verses:
+        if parts:
+            parts.append(" " if markers else "\n")
+            position += 1
+
+        parts.append(content)
+        offsets.append((verse_id, position, position + len(content)))
+        position += len(content)
+
+        if markers:
+            marker = f" \ufd3f{str(number).translate(ARABIC_DIGITS)}\ufd3e"
+            parts.append(marker)
+            position += len(marker)
+
+    return "".join(parts), offsets
+
+
+def get_page_rows(
+    connection: sqlite3.Connection, collections: bool = False
+) -> Iterator[Tuple[int, str, str, Optional[str]]]:
+    """
+    Assembles the page_texts rows one page at a time, from the verses and the
+    items read in page order.
+
+    Args:
+        connection (sqlite3.Connection): Database connection
+        collections (bool): Weather to include the text of each collection
+
+    Yields:
+        Tuple[int, str, str, Optional[str]]: Page id, content, offsets and
+        collections as JSON
+    """
+
+    verses = fetch_rows(
+        connection.execute(
+            'SELECT "page_id", "id", "number", "content" FROM "verses" '
+            'ORDER BY "page_id", "id"'
+        )
+    )
+    items = groupby(
+        (
+            fetch_rows(
+                connection.execute(
+                    'SELECT "verses"."page_id", "items"."collection_id", '
+                    '"verses"."id", "verses"."number", "items"."content" FROM "items" '
+                    'INNER JOIN "verses" ON ("items"."verse_id" = "verses"."id") '
+                    'ORDER BY "verses"."page_id", "items"."collection_id", "verses"."id"'
+                )
+            )
+            if collections
+            else []
+        ),
+        key=lambda row: row[0],
+    )
+    page_items = next(items, None)
+
+    for page_id, rows in groupby(verses, key=lambda row: row[0]):
+        content, offsets = get_page_text([row[1:] for row in rows])
+        texts: Dict[str, Dict[str, Any]] = {}
+
+        if page_items is not None and page_items[0] == page_id:
+            for collection_id, group in groupby(page_items[1], key=lambda row: row[1]):
+                text, text_offsets = get_page_text(
+                    [row[2:] for row in group], markers=False
+                )
+                texts[str(collection_id)] = {"content": text, "offsets": text_offsets}
+
+            page_items = next(items, None)
+
+        yield (
+            page_id,
+            content,
+            json.dumps(offsets, separators=(",", ":")),
+            json.dumps(texts, ensure_ascii=False) if texts else None,
+        )
+
+
+@memory.track
+def insert_page_texts(
+    database: sqlite3.Cursor, generate_sql: bool = False, collections: bool = False
+) -> None:
+    """
+    Assemble the text of every page into the page_texts table, so a page is a
+    single primary key read.
+
+    Each row has the page text with ﴿number﴾ verse markers, the offsets of its
+    verses as JSON and, optionally, the text and offsets of each collection
+    keyed by collection id.
 
     Args:
         database (sqlite3.Cursor): Database cursor
         generate_sql (bool): Weather to generate SQL statements
+        collections (bool): Weather to include the text of each collection
     """
 
-    translations = PARENT / "assets/data/translations.sql"
-    transliterations = PARENT / "assets/data/transliterations.sql"
+    schema = PARENT / "assets/schemas/page_texts.sql"
 
+    print("Inserting [bold]page texts[/bold]...", end=" ")
+    execute_sql_file(database, schema)
+
+    database.executemany(
+        'INSERT INTO "page_texts" ("page_id", "content", "offsets", "collections") '
+        "VALUES (?, ?, ?, ?)",
+        get_page_rows(database.connection, collections),
+    )
+
+    # The pages are assembled again for the script rather than kept in memory
     if generate_sql:
-        shutil.copyfile(INITIAL_SCHEMA, "sql/workflow/17-initial-schema.sql")
-        shutil.copyfile(translations, "sql/workflow/18-translations-initial.sql")
-        shutil.copyfile(INITIAL_SCHEMA, "sql/workflow/20-initial-schema.sql")
-        shutil.copyfile(
-            transliterations, "sql/workflow/21-transliterations-initial.sql"
+        with open(schema, "r", encoding="utf-8") as src, open_workflow(
+            "25-page-texts", transaction=False
+        ) as output:
+            output.write(src.read().rstrip() + "\n\nBEGIN;\n")
+
+            for batch in get_batched_insert(
+                "page_texts",
+                ["page_id", "content", "offsets", "collections"],
+                get_page_rows(database.connection, collections),
+            ):
+                output.write(batch)
+
+            output.write("COMMIT;\n")
+
+    print("[bold green]Done[/bold green]")
+
+
+@memory.track
+def insert_similar_verses(
+    database: sqlite3.Cursor, top_k: int = 10, jobs: int = 1
+) -> None:
+    """
+    Compute the top-k most similar verses of every verse into the similar_verses table.
+
+    Verses are compared with TF-IDF vectors of their unaccented words and, when
+    items exist, the words of their translations (collections of type 0). The
+    verses and items are streamed, the terms of every verse and the TF-IDF
+    matrix are held in memory.
+
+    Args:
+        database (sqlite3.Cursor): Database cursor
+        top_k (int): Number of similar verses to keep for each verse
+        jobs (int): Number of processes to compute the similarities with
+    """
+
+    similarity.require_numpy()
+
+    print("Computing [bold]similar verses[/bold]...", end=" ")
+
+    documents = {
+        verse_id: [unaccent(word) for word in get_words(content)]
+        for verse_id, content in fetch_rows(
+            database.connection.execute(
+                'SELECT "id", "content" FROM "verses" ORDER BY "id"'
+            )
         )
+    }
+
+    if database.execute(
+        "SELECT 1 FROM \"sqlite_master\" WHERE \"type\" = 'table' AND \"name\" = 'items'"
+    ).fetchone():
+        for verse_id, content in fetch_rows(
+            database.connection.execute(
+                'SELECT "items"."verse_id", "items"."content" FROM "items" '
+                'INNER JOIN "collections" '
+                'ON ("items"."collection_id" = "collections"."id") '
+                'WHERE "collections"."type" = 0 AND "items"."verse_id" IS NOT NULL'
+            )
+        ):
+            documents[verse_id].extend(similarity.tokenize(content))
+
+    # The similarities are inserted as each block of verses is computed
+    ids = list(documents)
+    rows = (
+        (rank, score, ids[row], ids[neighbour])
+        for row, neighbour, rank, score in similarity.get_similar(
+            [documents[verse_id] for verse_id in ids], top_k, jobs
+        )
+    )
+
+    execute_sql_file(database, PARENT / "assets/schemas/similarity.sql")
+    database.executemany(
+        'INSERT INTO "similar_verses" ("rank", "score", "verse_id", "similar_id") '
+        "VALUES (?, ?, ?, ?)",
+        rows,
+    )
+    execute_sql_script(
+        database,
+        'CREATE UNIQUE INDEX "similar_verses_verse_id_rank_42eabf7c_uniq" '
+        'ON "similar_verses" ("verse_id", "rank");',
+    )
+
+    print("[bold green]Done[/bold green]")
+
+
+@memory.track
+def insert_synthetic_collections(
+    database: sqlite3.Cursor, languages: int = 10, collections: int = 30, seed: int = 0
+) -> None:
+    """
+    Add synthetic languages, collections and items, one item per verse and
+    collection, to load test the database at scale.
+
+    Collections are spread over the new languages and cycle through the
+    collection types, items follow the length of their verse.
+
+    Args:
+        database (sqlite3.Cursor): Database cursor
+        languages (int): Number of languages to add
+        collections (int): Number of collections to add
+        seed (int): Random seed, the same seed generates the same data
+    """
+
+    if languages < 1:
+        raise ValueError("At least one language is required")
+
+    print(f"Inserting [bold]{collections}[/bold] synthetic collections...", end=" ")
+
+    if not database.execute(
+        "SELECT 1 FROM \"sqlite_master\" WHERE \"type\" = 'table' AND \"name\" = 'items'"
+    ).fetchone():
+        execute_sql_file(database, PARENT / "assets/schemas/comp.sql")
 
-    print("Inserting [bold]trans[/bold]...")
-    apply_initial_schema(database)
-    execute_sql_file(database, translations)
-    insert_items(database, 2, generate_sql, "19-translations")
-    apply_initial_schema(database)
-    execute_sql_file(database, transliterations)
-    insert_items(database, 3, generate_sql, "22-transliterations")
+    codes = synthetic.get_language_codes(
+        languages,
+        {row[0] for row in database.execute('SELECT "code" FROM "languages"')},
+    )
+    language_ids = []
+    for code in codes:
+        database.execute(
+            'INSERT INTO "languages" ("name", "code") VALUES (?, ?)',
+            (f"Synthetic {code}", code),
+        )
+        language_ids.append(database.lastrowid)
+
+    verses = [
+        (verse_id, len(get_words(content)))
+        for verse_id, content in database.execute(
+            'SELECT "id", "content" FROM "verses" ORDER BY "id"'
+        ).fetchall()
+    ]
+    offset = database.execute('SELECT COUNT(*) FROM "collections"').fetchone()[0]
+
+    for i in range(collections):
+        kind = i % len(synthetic.TYPES)
+        name, ratio = synthetic.TYPES[kind]
+        language = i % len(language_ids)
+
+        database.execute(
+            'INSERT INTO "collections" ("type", "name", "language_id") '
+            "VALUES (?, ?, ?)",
+            (kind, f"Synthetic {name} {offset + i + 1}", language_ids[language]),
+        )
+        collection_id = database.lastrowid
+        items = synthetic.get_items(
+            verses,
+            synthetic.get_vocabulary(seed * 1000 + language),
+            ratio,
+            seed * 100000 + i,
+        )
+        item_id = database.execute(
+            'SELECT COALESCE(MAX("id"), 0) FROM "items"'
+        ).fetchone()[0]
+
+        # Explicit ids, the clustered items layout can not generate them
+        database.executemany(
+            'INSERT INTO "items" ("id", "content", "collection_id", "verse_id") '
+            f"VALUES (?, ?, {collection_id}, ?)",
+            (
+                (item_id + n, content, verse_id)
+                for n, (content, verse_id) in enumerate(items, start=1)
+            ),
+        )
+
+    print("[bold green]Done[/bold green]")
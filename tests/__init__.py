@@ -0,0 +1,35 @@
+"""Quran CLI tests, run with `python -m unittest`"""
+
+import os
+from pathlib import Path
+from typer.testing import CliRunner
+
+from quran_cli.main import app
+
+
+def build_database(directory: str) -> Path:
+    """
+    Builds a normalized database with the collections, as the README does.
+
+    Args:
+        directory (str): Folder to build the database in, `init` writes to the
+        working directory
+
+    Returns:
+        Path: Database file path
+    """
+
+    runner, cwd = CliRunner(), os.getcwd()
+    os.chdir(directory)
+
+    try:
+        for args in (["init"], ["normalize", "-d"], ["interpret", "-j", "1"]):
+            result = runner.invoke(app, [*args, "db.sqlite3"])
+
+            if result.exit_code or "Error" in result.output:
+                raise RuntimeError(f"{' '.join(args)} failed: {result.output}")
+
+    finally:
+        os.chdir(cwd)
+
+    return Path(directory) / "db.sqlite3"
@@ -0,0 +1,66 @@
+"""Export tests"""
+
+import re
+import sqlite3
+import tempfile
+import unittest
+
+from quran_cli.commands.export import get_postgres_schema
+from tests import build_database
+
+
+# Constants
+COLUMN = re.compile(r'^\s*"(\w+)" (\w+)(?:\((\d+)\))?')
+
+
+class PostgresSchemaTest(unittest.TestCase):
+    """The PostgreSQL DDL fits the data of a real build"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.connection = sqlite3.connect(build_database(cls.directory.name))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.connection.close()
+        cls.directory.cleanup()
+
+    def test_lengths_fit_the_data(self) -> None:
+        tables = [
+            row[0]
+            for row in self.connection.execute(
+                'SELECT "name" FROM "sqlite_master" WHERE "type" = \'table\''
+            )
+        ]
+
+        for table in tables:
+            statement, _ = get_postgres_schema(self.connection, table)
+
+            for line in statement.splitlines():
+                match = COLUMN.match(line)
+
+                if match is None or match[3] is None:
+                    continue
+
+                column, limit = match[1], int(match[3])
+                longest = self.connection.execute(
+                    f'SELECT MAX(LENGTH("{column}")) FROM "{table}"'
+                ).fetchone()[0]
+
+                with self.subTest(table=table, column=column):
+                    self.assertLessEqual(longest or 0, limit)
+
+    def test_verse_content_is_text(self) -> None:
+        longest = self.connection.execute(
+            'SELECT MAX(LENGTH("content")) FROM "verses"'
+        ).fetchone()[0]
+        statement, _ = get_postgres_schema(self.connection, "verses")
+
+        # The longest verse is longer than its declared varchar(1024)
+        self.assertGreater(longest, 1024)
+        self.assertIn('"content" text NOT NULL', statement)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Items layouts tests"""
+
+from contextlib import redirect_stdout
+import io
+import sqlite3
+import tempfile
+import unittest
+
+from quran_cli import utils
+from tests import build_database
+
+
+class ItemsLayoutTest(unittest.TestCase):
+    """The items ids stay unique in every layout"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = build_database(cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.directory.cleanup()
+
+    def setUp(self) -> None:
+        self.connection = sqlite3.connect(self.path)
+
+    def tearDown(self) -> None:
+        self.connection.rollback()
+        self.connection.close()
+
+    def apply_layout(self, layout: str) -> None:
+        with redirect_stdout(io.StringIO()):
+            utils.apply_items_layout(self.connection.cursor(), layout)
+
+    def insert_duplicate(self) -> None:
+        item_id, collection_id, verse_id = self.connection.execute(
+            'SELECT "id", "collection_id", "verse_id" FROM "items" LIMIT 1'
+        ).fetchone()
+
+        self.connection.execute(
+            'INSERT INTO "items" ("id", "content", "collection_id", "verse_id") '
+            "VALUES (?, ?, ?, ?)",
+            (item_id, "duplicate", collection_id, verse_id + 1),
+        )
+
+    def test_layouts_reject_duplicate_ids(self) -> None:
+        for layout in ["clustered", "rowid"]:
+            with self.subTest(layout=layout):
+                self.apply_layout(layout)
+
+                with self.assertRaises(sqlite3.IntegrityError):
+                    self.insert_duplicate()
+
+    def test_clustered_id_lookup_uses_an_index(self) -> None:
+        self.apply_layout("clustered")
+
+        plan = self.connection.execute(
+            'EXPLAIN QUERY PLAN SELECT * FROM "items" WHERE "id" = ?', (1,)
+        ).fetchall()
+
+        self.assertIn("USING INDEX", plan[0][3])
+        self.apply_layout("rowid")
+
+
+if __name__ == "__main__":
+    unittest.main()